@@ -2,9 +2,12 @@ from typing import List, Optional
 
 from .core import init_env_from_args, mcp
 # Importing registers tools via decorators
-from . import workflow  # noqa: F401
+from . import workflow
 from . import guides  # noqa: F401
 
+# Workflow tool modules load lazily; import them all so every tool is registered
+workflow.register_tools()
+
 
 def main(argv: Optional[List[str]] = None) -> None:
     init_env_from_args(argv)
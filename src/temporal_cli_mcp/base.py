@@ -1,29 +1,81 @@
-"""Abstract base classes for command handling."""
+"""Command execution and base classes for command handling."""
 
 import asyncio
-import json
 import logging
+import shlex
+import shutil
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Protocol
 
 from .command_builder import TemporalCommandBuilder
 from .config import config
+from .json_codec import ijson, loads
 from .exceptions import CommandExecutionError, TemporalCLINotFoundError
 
 
 logger = logging.getLogger(__name__)
 
 
-class CommandExecutor(ABC):
-    """Abstract base class for command execution."""
+@lru_cache(maxsize=None)
+def _resolve_executable(name: str) -> str:
+    """Resolve an executable to an absolute path (posix_spawn needs a path)."""
+    path = shutil.which(name)
+    if path is None:
+        raise FileNotFoundError(name)
+    return path
+
+
+def warm_up(executable: str = "temporal") -> None:
+    """Resolve the CLI path ahead of the first command.
+    
+    A missing CLI is reported when a command executes.
+    """
+    try:
+        _resolve_executable(executable)
+    except FileNotFoundError:
+        pass
+
+
+async def _spawn(cmd: List[str]) -> asyncio.subprocess.Process:
+    """Start a command with stdout/stderr pipes.
+    
+    With an absolute executable path and close_fds=False, subprocess.Popen
+    uses posix_spawn instead of fork+exec. Only inheritable descriptors are
+    passed to the child, and Python creates descriptors non-inheritable.
+    """
+    return await asyncio.create_subprocess_exec(
+        _resolve_executable(cmd[0]), *cmd[1:],
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        close_fds=False,
+    )
+
+
+async def _kill(proc: asyncio.subprocess.Process) -> None:
+    """Kill and reap a process (used on timeout or cancellation)."""
+    if proc.returncode is None:
+        proc.kill()
+    # Reap even if the caller is being cancelled, so no zombie is left behind
+    await asyncio.shield(proc.wait())
+
+
+def _looks_like_json(data: bytes) -> bool:
+    """Cheap check that output starts like a JSON object or array."""
+    head = data[:64].lstrip()[:1]
+    # All-whitespace prefix is unusual; let the real parser decide
+    return head in (b"{", b"[") or not head
+
+
+class CommandExecutor(Protocol):
+    """Interface for command execution (structural, no runtime dispatch cost)."""
     
-    @abstractmethod
     async def execute(self, cmd: List[str]) -> Dict[str, Any]:
         """Execute a command and return structured result."""
-        pass
+        ...
 
 
-class AsyncCommandExecutor(CommandExecutor):
+class AsyncCommandExecutor:
     """Async implementation of command executor."""
     
     def __init__(self, timeout: float = None):
@@ -31,42 +83,144 @@ class AsyncCommandExecutor(CommandExecutor):
     
     async def execute(self, cmd: List[str]) -> Dict[str, Any]:
         """Execute command asynchronously."""
-        logger.info(f"Executing command: {' '.join(cmd)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Executing command: %s", shlex.join(cmd))
         
         try:
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+            proc = await _spawn(cmd)
+            try:
+                async with asyncio.timeout(self.timeout):
+                    stdout, stderr = await proc.communicate()
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                await _kill(proc)
+                raise
+            returncode = proc.returncode
+            
+            stderr_str = stderr.decode('utf-8') if stderr else ""
+            
+            result = {
+                "success": returncode == 0,
+                "returncode": returncode,
+                "stderr": stderr_str,
+            }
+            # Echoing argv is only useful for debugging failures (and --input can be large)
+            if returncode != 0 or config.include_cmd_in_response:
+                result["cmd"] = tuple(cmd)
+            
+            if returncode != 0:
+                result["stdout"] = stdout.decode('utf-8') if stdout else ""
+                logger.error(f"Command failed with return code {returncode}: {stderr_str}")
+                return result
+            
+            result["data"] = None
+            if not stdout:
+                return result
             
-            stdout, stderr = await asyncio.wait_for(
-                proc.communicate(), 
-                timeout=self.timeout
+            # Skip the parser (and its exception path) for plain-text output
+            if _looks_like_json(stdout):
+                try:
+                    # Parse the raw bytes directly; stdout is only decoded if we need to echo it
+                    result["data"] = loads(stdout)
+                    return result
+                except ValueError:
+                    # JSONDecodeError (stdlib or orjson) and UnicodeDecodeError
+                    pass
+            
+            result["stdout"] = stdout.decode('utf-8', errors='replace')
+            result["json_error"] = "Failed to parse JSON output from temporal CLI"
+            result["cmd"] = tuple(cmd)
+            return result
+            
+        except FileNotFoundError:
+            raise TemporalCLINotFoundError("temporal CLI not found. Please install Temporal CLI.")
+        except asyncio.TimeoutError:
+            raise CommandExecutionError(
+                f"Command timed out after {self.timeout}s",
+                cmd, -1, "Timeout"
             )
+
+    
+    async def execute_stream(
+        self,
+        cmd: List[str],
+        key: str = "events",
+        keep: Optional[Callable[[Any], bool]] = None,
+    ) -> Dict[str, Any]:
+        """Execute command and stream-parse the items of the top-level ``key`` array.
+        
+        Items are parsed straight from the stdout pipe with ijson, so the raw CLI
+        output is never buffered in full. Falls back to ``execute`` when ijson is
+        not installed. In both cases ``data`` is ``{key: [items...]}``.
+        
+        If ``keep`` is given, only items it accepts are collected (the others are
+        dropped as they are parsed) and ``item_count`` holds the number of items
+        parsed in total.
+        """
+        if ijson is None:
+            result = await self.execute(cmd)
+            if isinstance(result.get("data"), dict):
+                items = result["data"].get(key, [])
+                if keep is not None and isinstance(items, list):
+                    result["item_count"] = len(items)
+                    items = [item for item in items if keep(item)]
+                result["data"] = {key: items}
+            return result
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Executing command (streaming): %s", shlex.join(cmd))
+        
+        try:
+            proc = await _spawn(cmd)
+            
+            item_count = 0
+            
+            async def _collect_items() -> tuple[List[Any], str]:
+                nonlocal item_count
+                items: List[Any] = []
+                try:
+                    async for item in ijson.items(proc.stdout, f"{key}.item", use_float=True):
+                        item_count += 1
+                        if keep is None or keep(item):
+                            items.append(item)
+                except ijson.JSONError as e:
+                    # Drain whatever is left so the process can exit
+                    await proc.stdout.read()
+                    return items, str(e)
+                return items, ""
+            
+            try:
+                async with asyncio.timeout(self.timeout):
+                    (items, parse_error), stderr, returncode = await asyncio.gather(
+                        _collect_items(), proc.stderr.read(), proc.wait()
+                    )
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                # Don't leave the CLI running (and blocked on a full pipe) behind us
+                await _kill(proc)
+                raise
             
-            stdout_str = stdout.decode('utf-8') if stdout else ""
             stderr_str = stderr.decode('utf-8') if stderr else ""
             
             result = {
-                "success": proc.returncode == 0,
-                "returncode": proc.returncode,
-                "stdout": stdout_str,
+                "success": returncode == 0,
+                "returncode": returncode,
                 "stderr": stderr_str,
-                "cmd": cmd,
             }
+            # Echoing argv is only useful for debugging failures (and --input can be large)
+            if returncode != 0 or config.include_cmd_in_response:
+                result["cmd"] = tuple(cmd)
             
-            if proc.returncode == 0:
-                try:
-                    result["data"] = json.loads(stdout_str) if stdout_str else None
-                    # to save on tokens, we can remove the raw stdout field
-                    del result["stdout"]
-                except json.JSONDecodeError:
+            if returncode == 0:
+                if parse_error:
                     result["data"] = None
                     result["json_error"] = "Failed to parse JSON output from temporal CLI"
+                    result["cmd"] = tuple(cmd)
+                else:
+                    result["data"] = {key: items}
+                    if keep is not None:
+                        result["item_count"] = item_count
             else:
-                logger.error(f"Command failed with return code {proc.returncode}: {stderr_str}")
-                
+                logger.error(f"Command failed with return code {returncode}: {stderr_str}")
+            
             return result
             
         except FileNotFoundError:
@@ -1,57 +1,154 @@
 """Command builder for Temporal CLI commands."""
 
+import re
+import sys
+from functools import lru_cache
 from typing import List, Optional, Any, Dict
 
+from .query_builder import create_query_builder
+
+
+# Flag strings shared by every command; dashed literals are not auto-interned
+_TEMPORAL = sys.intern("temporal")
+_ENV_FLAG = sys.intern("--env")
+_OUTPUT_FLAG = sys.intern("-o")
+_TIME_FORMAT_FLAG = sys.intern("--time-format")
+_COMMAND_TIMEOUT_FLAG = sys.intern("--command-timeout")
+
+# Quote and parenthesis characters checked by query validation
+_QUERY_DELIMITER_RE = re.compile(r"['()]")
+
+
+@lru_cache(maxsize=256)
+def _has_balanced_delimiters(query: str) -> bool:
+    """Check quotes and parentheses are balanced using a single pass over the query."""
+    quotes = opens = closes = 0
+    for ch in _QUERY_DELIMITER_RE.findall(query):
+        if ch == "'":
+            quotes += 1
+        elif ch == "(":
+            opens += 1
+        else:
+            closes += 1
+    return quotes % 2 == 0 and opens == closes
+
+
+# Argument tuples for workflow subcommands; the builder methods hand out fresh
+# lists. Read-only commands are rebuilt with the same workflow IDs/queries
+# across tool calls, so they are memoized. Commands that carry free-form
+# --input/--reason payloads or change workflow state are rarely repeated and
+# are built directly, so the cache never pins large payloads.
+
+@lru_cache(maxsize=1024)
+def _build_list(query: Optional[str], limit: int) -> tuple:
+    if query:
+        return ("workflow", "list", "--limit", str(limit), "--query", query)
+    return ("workflow", "list", "--limit", str(limit))
+
+
+@lru_cache(maxsize=1024)
+def _build_describe(workflow_id: str) -> tuple:
+    return ("workflow", "describe", "--workflow-id", workflow_id)
+
+
+def _build_start(
+    workflow_type: str,
+    task_queue: str,
+    workflow_id: Optional[str],
+    input_data: Optional[str]
+) -> tuple:
+    args = ("workflow", "start", "--type", workflow_type, "--task-queue", task_queue)
+    if workflow_id:
+        args += ("--workflow-id", workflow_id)
+    if input_data:
+        args += ("--input", input_data)
+    return args
+
+
+def _build_signal(workflow_id: str, signal_name: str, input_data: Optional[str]) -> tuple:
+    args = ("workflow", "signal", "--workflow-id", workflow_id, "--name", signal_name)
+    if input_data:
+        args += ("--input", input_data)
+    return args
+
+
+def _build_query(workflow_id: str, query_type: str, input_data: Optional[str]) -> tuple:
+    args = ("workflow", "query", "--workflow-id", workflow_id, "--type", query_type)
+    if input_data:
+        args += ("--input", input_data)
+    return args
+
+
+def _build_cancel(workflow_id: str) -> tuple:
+    return ("workflow", "cancel", "--workflow-id", workflow_id)
+
+
+def _build_terminate(workflow_id: str, reason: Optional[str]) -> tuple:
+    args = ("workflow", "terminate", "--workflow-id", workflow_id)
+    if reason:
+        args += ("--reason", reason)
+    return args
+
+
+@lru_cache(maxsize=1024)
+def _build_history(workflow_id: str, run_id: Optional[str]) -> tuple:
+    args = ("workflow", "show", "--workflow-id", workflow_id)
+    if run_id:
+        args += ("--run-id", run_id)
+    return args
+
+
+@lru_cache(maxsize=1024)
+def _build_stack(workflow_id: str, run_id: Optional[str]) -> tuple:
+    args = ("workflow", "stack", "--workflow-id", workflow_id)
+    if run_id:
+        args += ("--run-id", run_id)
+    return args
+
 
 class TemporalCommandBuilder:
     """Builder for constructing Temporal CLI commands with proper argument handling."""
     
     def __init__(self, env: Optional[str] = None, timeout_seconds: Optional[float] = None):
         self.env = env
-        self.output_format = "json"
-        self.time_format = "iso"
+        self.output_format = sys.intern("json")
+        self.time_format = sys.intern("iso")
         self.timeout_seconds = timeout_seconds
+        # Global flags never change after construction, so build them once
+        self._global_flags = tuple(self._build_global_flags())
     
     def _build_global_flags(self) -> List[str]:
         """Build global flags that apply to all commands."""
         flags = []
         if self.env:
-            flags.extend(["--env", self.env])
-        flags.extend(["-o", self.output_format, "--time-format", self.time_format])
+            flags.extend((_ENV_FLAG, self.env))
+        flags.extend((_OUTPUT_FLAG, self.output_format, _TIME_FORMAT_FLAG, self.time_format))
         
         # Add command timeout if specified
         if self.timeout_seconds is not None:
             # Convert to Temporal CLI duration format (e.g., "60s")
             timeout_str = f"{int(self.timeout_seconds)}s"
-            flags.extend(["--command-timeout", timeout_str])
+            flags.extend((_COMMAND_TIMEOUT_FLAG, timeout_str))
         
         return flags
     
     def build_workflow_list(self, query: Optional[str] = None, limit: int = 10) -> List[str]:
         """Build workflow list command with optional query filtering."""
-        args = ["workflow", "list", "--limit", str(limit)]
-        if query and query.strip():
+        if query and not query.isspace():
             # Validate query before adding it
-            if self._is_valid_query(query):
-                args.extend(["--query", query])
-            else:
+            if not self._is_valid_query(query):
                 raise ValueError(f"Invalid query format: {query}")
-        return args
+        else:
+            query = None
+        return list(_build_list(query, limit))
     
     def _is_valid_query(self, query: str) -> bool:
         """Basic validation for query strings."""
-        if not query or not query.strip():
+        if not query or query.isspace():
             return True  # Empty queries are valid
         
-        # Check for balanced quotes
-        if query.count("'") % 2 != 0:
-            return False
-        
-        # Check for balanced parentheses
-        if query.count("(") != query.count(")"):
-            return False
-        
-        return True
+        # Check for balanced quotes and parentheses
+        return _has_balanced_delimiters(query)
     
     def build_workflow_list_with_structured_query(
         self, 
@@ -62,38 +159,30 @@ class TemporalCommandBuilder:
         if not structured_query:
             return self.build_workflow_list(None, limit)
         
-        # Import here to avoid circular imports
-        from .query_builder import create_query_builder
-        
-        builder = create_query_builder()
+        conditions: List[str] = []
         
         # Process field filters
-        if "field_filters" in structured_query:
-            for field_filter in structured_query["field_filters"]:
-                condition = f"{field_filter['field']} {field_filter['operator']} '{field_filter['value']}'"
-                builder.custom_condition(condition)
+        for field_filter in structured_query.get("field_filters", ()):
+            conditions.append(f"{field_filter['field']} {field_filter['operator']} '{field_filter['value']}'")
         
         # Process time range filters
-        if "time_range_filters" in structured_query:
-            for time_filter in structured_query["time_range_filters"]:
-                start_time = time_filter["start_time"]
-                end_time = time_filter["end_time"]
-                condition = f"{time_filter['field']} BETWEEN '{start_time}' AND '{end_time}'"
-                builder.custom_condition(condition)
+        for time_filter in structured_query.get("time_range_filters", ()):
+            conditions.append(
+                f"{time_filter['field']} BETWEEN '{time_filter['start_time']}' AND '{time_filter['end_time']}'"
+            )
         
         # Process IN filters
-        if "in_filters" in structured_query:
-            for in_filter in structured_query["in_filters"]:
-                values_str = ", ".join([f"'{value}'" for value in in_filter["values"]])
-                condition = f"{in_filter['field']} IN ({values_str})"
-                builder.custom_condition(condition)
+        for in_filter in structured_query.get("in_filters", ()):
+            values_str = ", ".join(f"'{value}'" for value in in_filter["values"])
+            conditions.append(f"{in_filter['field']} IN ({values_str})")
         
+        builder = create_query_builder().extend_conditions(conditions)
         query_string = builder.build()
         return self.build_workflow_list(query_string, limit)
     
     def build_workflow_describe(self, workflow_id: str) -> List[str]:
         """Build workflow describe command."""
-        return ["workflow", "describe", "--workflow-id", workflow_id]
+        return list(_build_describe(workflow_id))
     
     def build_workflow_start(
         self,
@@ -103,12 +192,7 @@ class TemporalCommandBuilder:
         input_data: Optional[str] = None
     ) -> List[str]:
         """Build workflow start command."""
-        args = ["workflow", "start", "--type", workflow_type, "--task-queue", task_queue]
-        if workflow_id:
-            args.extend(["--workflow-id", workflow_id])
-        if input_data:
-            args.extend(["--input", input_data])
-        return args
+        return list(_build_start(workflow_type, task_queue, workflow_id, input_data))
     
     def build_workflow_signal(
         self,
@@ -117,10 +201,7 @@ class TemporalCommandBuilder:
         input_data: Optional[str] = None
     ) -> List[str]:
         """Build workflow signal command."""
-        args = ["workflow", "signal", "--workflow-id", workflow_id, "--name", signal_name]
-        if input_data:
-            args.extend(["--input", input_data])
-        return args
+        return list(_build_signal(workflow_id, signal_name, input_data))
     
     def build_workflow_query(
         self,
@@ -129,14 +210,11 @@ class TemporalCommandBuilder:
         input_data: Optional[str] = None
     ) -> List[str]:
         """Build workflow query command."""
-        args = ["workflow", "query", "--workflow-id", workflow_id, "--type", query_type]
-        if input_data:
-            args.extend(["--input", input_data])
-        return args
+        return list(_build_query(workflow_id, query_type, input_data))
     
     def build_workflow_cancel(self, workflow_id: str) -> List[str]:
         """Build workflow cancel command."""
-        return ["workflow", "cancel", "--workflow-id", workflow_id]
+        return list(_build_cancel(workflow_id))
     
     def build_workflow_terminate(
         self,
@@ -144,10 +222,7 @@ class TemporalCommandBuilder:
         reason: Optional[str] = None
     ) -> List[str]:
         """Build workflow terminate command."""
-        args = ["workflow", "terminate", "--workflow-id", workflow_id]
-        if reason:
-            args.extend(["--reason", reason])
-        return args
+        return list(_build_terminate(workflow_id, reason))
     
     def build_workflow_history(
         self,
@@ -155,10 +230,7 @@ class TemporalCommandBuilder:
         run_id: Optional[str] = None
     ) -> List[str]:
         """Build workflow history command."""
-        args = ["workflow", "show", "--workflow-id", workflow_id]
-        if run_id:
-            args.extend(["--run-id", run_id])
-        return args
+        return list(_build_history(workflow_id, run_id))
     
     def build_workflow_stack(
         self,
@@ -166,11 +238,8 @@ class TemporalCommandBuilder:
         run_id: Optional[str] = None
     ) -> List[str]:
         """Build workflow stack command."""
-        args = ["workflow", "stack", "--workflow-id", workflow_id]
-        if run_id:
-            args.extend(["--run-id", run_id])
-        return args
+        return list(_build_stack(workflow_id, run_id))
     
     def build_full_command(self, workflow_args: List[str]) -> List[str]:
         """Build complete command with global flags."""
-        return ["temporal"] + self._build_global_flags() + workflow_args
\ No newline at end of file
+        return [_TEMPORAL, *self._global_flags, *workflow_args]
\ No newline at end of file
@@ -13,14 +13,26 @@ class TemporalConfig:
     time_format: str = "iso"
     log_level: str = "INFO"
     timeout: float = 60.0  # Default 60s - increase for large workflow histories
+    include_cmd_in_response: bool = False  # Echo argv in successful results too
     
     def setup_logging(self) -> None:
-        """Setup logging configuration."""
-        logging.basicConfig(
-            level=getattr(logging, self.log_level.upper()),
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
+        """Setup logging configuration.
+        
+        Human-readable timestamps (strftime per record) are only used at DEBUG;
+        other levels log the raw epoch timestamp, which needs no formatting.
+        """
+        level = self.log_level.upper()
+        if level == "DEBUG":
+            logging.basicConfig(
+                level=logging.DEBUG,
+                format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S"
+            )
+        else:
+            logging.basicConfig(
+                level=getattr(logging, level),
+                format="%(created).3f - %(name)s - %(levelname)s - %(message)s"
+            )
 
 
 # Global configuration instance
@@ -1,10 +1,13 @@
-import argparse
-import json
 import subprocess
-from typing import Any, Dict, List, Optional
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from fastmcp import FastMCP
 
+if TYPE_CHECKING:
+    import argparse
+
 
 # MCP server instance
 mcp = FastMCP("Temporal CLI MCP Server")
@@ -13,30 +16,37 @@ mcp = FastMCP("Temporal CLI MCP Server")
 _TEMPORAL_GLOBAL_PREFIX: List[str] = []
 
 
+@lru_cache(maxsize=8)
+def _get_exec_builder(env: Optional[str], timeout: float) -> Tuple[Any, Any]:
+    """Return a shared (executor, builder) pair for the given env and timeout."""
+    from .base import AsyncCommandExecutor
+    from .command_builder import TemporalCommandBuilder
+    
+    return AsyncCommandExecutor(timeout), TemporalCommandBuilder(env=env)
+
+
 async def run_temporal_command(args: List[str], *, output: str = "json") -> Dict[str, Any]:
     """Execute a temporal CLI command and return the result with optional JSON parsing.
 
     DEPRECATED: Use AsyncCommandExecutor with TemporalCommandBuilder instead.
     This function is kept for backward compatibility.
     """
-    from .base import AsyncCommandExecutor
-    from .command_builder import TemporalCommandBuilder
     from .config import config
     
-    # Create executor and builder
-    executor = AsyncCommandExecutor()
-    builder = TemporalCommandBuilder(env=config.env)
+    executor, builder = _get_exec_builder(config.env, config.timeout)
     
-    # Build command with global flags
-    global_flags: List[str] = list(_TEMPORAL_GLOBAL_PREFIX)
     if output == "json":
-        global_flags += ["-o", "json", "--time-format", "iso"]
-    
-    cmd = ["temporal"] + global_flags + args
+        # Builder carries --env plus the JSON/time-format flags
+        cmd = builder.build_full_command(args)
+    else:
+        cmd = ["temporal", *_TEMPORAL_GLOBAL_PREFIX, *args]
     return await executor.execute(cmd)
 
 
-def build_arg_parser() -> argparse.ArgumentParser:
+def build_arg_parser() -> "argparse.ArgumentParser":
+    """Build the full argparse parser (only needed to render --help)."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         prog="temporal-cli-mcp",
         add_help=True,
@@ -54,19 +64,46 @@ def build_arg_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _parse_env_arg(argv: List[str]) -> Optional[str]:
+    """Find the value of ``--env VALUE`` / ``--env=VALUE`` without argparse.
+    
+    Unknown arguments are ignored; the last occurrence wins.
+    """
+    env = None
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--env" and i + 1 < len(argv):
+            env = argv[i + 1]
+            i += 1
+        elif arg.startswith("--env="):
+            env = arg.split("=", 1)[1]
+        i += 1
+    return env
+
+
 def init_env_from_args(argv: Optional[List[str]] = None) -> None:
     from .config import config
     
     global _TEMPORAL_GLOBAL_PREFIX
-    parser = build_arg_parser()
-    args, _unknown = parser.parse_known_args(argv)
+    if argv is None:
+        argv = sys.argv[1:]
     
-    if args.env:
-        _TEMPORAL_GLOBAL_PREFIX = ["--env", args.env]
-        config.env = args.env
+    if "-h" in argv or "--help" in argv:
+        build_arg_parser().parse_known_args(argv)  # prints help and exits
+    
+    env = _parse_env_arg(argv)
+    if env:
+        _TEMPORAL_GLOBAL_PREFIX = ["--env", env]
+        config.env = env
+        _get_exec_builder.cache_clear()
     
     # Setup logging
     config.setup_logging()
+    
+    # Resolve the CLI path at server start rather than on the first tool call
+    from .base import warm_up
+    warm_up()
 
 
 __all__ = [
@@ -0,0 +1,45 @@
+"""JSON encoding/decoding helpers with optional orjson acceleration.
+
+orjson parses bytes directly and is considerably faster than the stdlib
+parser on the large documents produced by ``temporal workflow show``. It is
+an optional dependency; the stdlib ``json`` module is used when it is missing.
+
+ijson, when installed, allows streaming the items of a large JSON array
+straight from a subprocess pipe instead of buffering the whole document.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - ijson is optional
+    ijson = None
+
+
+if orjson is not None:
+    loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+else:
+    loads = json.loads
+    JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any) -> str:
+    """Serialize ``obj`` to a compact JSON string."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+__all__ = [
+    "dumps",
+    "loads",
+    "JSONDecodeError",
+    "ijson",
+]
@@ -2,22 +2,49 @@
 
 from datetime import datetime
 from typing import List, Optional, Union
-from pydantic import BaseModel, Field, validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from enum import Enum
 
 
-class WorkflowListRequest(BaseModel):
+class RequestModel(BaseModel):
+    """Base class for workflow tool request models."""
+
+    # Requests are never mutated after validation
+    model_config = ConfigDict(frozen=True)
+
+
+# Bounds for workflow list limits
+LIST_LIMIT_MIN = 1
+LIST_LIMIT_MAX = 1000
+
+
+class WorkflowListRequest(RequestModel):
     """Model for list_workflows parameters."""
     query: Optional[str] = None
-    limit: int = Field(default=10, ge=1, le=1000)
+    limit: int = Field(default=10, ge=LIST_LIMIT_MIN, le=LIST_LIMIT_MAX)
+
+    @classmethod
+    def fast_build(cls, query: Optional[str], limit: int) -> "WorkflowListRequest":
+        """Create a request, skipping pydantic-core when the input is plainly valid.
 
+        Falls back to full validation for anything else, so invalid input
+        raises the same pydantic ValidationError as normal construction.
+        """
+        if (
+            (query is None or type(query) is str)
+            and type(limit) is int
+            and LIST_LIMIT_MIN <= limit <= LIST_LIMIT_MAX
+        ):
+            return cls.model_construct(query=query, limit=limit)
+        return cls(query=query, limit=limit)
 
-class WorkflowDescribeRequest(BaseModel):
+
+class WorkflowDescribeRequest(RequestModel):
     """Model for describe_workflow parameters."""
     workflow_id: str = Field(..., min_length=1)
 
 
-class WorkflowStartRequest(BaseModel):
+class WorkflowStartRequest(RequestModel):
     """Model for start_workflow parameters."""
     workflow_type: str = Field(..., min_length=1)
     task_queue: str = Field(..., min_length=1)
@@ -25,39 +52,59 @@ class WorkflowStartRequest(BaseModel):
     input_data: Optional[str] = None
 
 
-class WorkflowSignalRequest(BaseModel):
+class WorkflowSignalRequest(RequestModel):
     """Model for signal_workflow parameters."""
     workflow_id: str = Field(..., min_length=1)
     signal_name: str = Field(..., min_length=1)
     input_data: Optional[str] = None
 
 
-class WorkflowQueryRequest(BaseModel):
+class WorkflowQueryRequest(RequestModel):
     """Model for query_workflow parameters."""
     workflow_id: str = Field(..., min_length=1)
     query_type: str = Field(..., min_length=1)
     input_data: Optional[str] = None
 
 
-class WorkflowCancelRequest(BaseModel):
+class WorkflowCancelRequest(RequestModel):
     """Model for cancel_workflow parameters."""
     workflow_id: str = Field(..., min_length=1)
 
 
-class WorkflowTerminateRequest(BaseModel):
+class WorkflowTerminateRequest(RequestModel):
     """Model for terminate_workflow parameters."""
     workflow_id: str = Field(..., min_length=1)
     reason: Optional[str] = None
 
 
-class WorkflowHistoryRequest(BaseModel):
+class WorkflowHistoryRequest(RequestModel):
     """Model for get_workflow_history parameters."""
     workflow_id: str = Field(..., min_length=1)
     run_id: Optional[str] = None
     decode_payloads: bool = True
 
-
-class WorkflowStackRequest(BaseModel):
+    @classmethod
+    def fast_build(
+        cls, workflow_id: str, run_id: Optional[str], decode_payloads: bool
+    ) -> "WorkflowHistoryRequest":
+        """Create a request, skipping pydantic-core when the input is plainly valid.
+
+        Falls back to full validation for anything else, so invalid input
+        raises the same pydantic ValidationError as normal construction.
+        """
+        if (
+            type(workflow_id) is str
+            and workflow_id
+            and (run_id is None or type(run_id) is str)
+            and type(decode_payloads) is bool
+        ):
+            return cls.model_construct(
+                workflow_id=workflow_id, run_id=run_id, decode_payloads=decode_payloads
+            )
+        return cls(workflow_id=workflow_id, run_id=run_id, decode_payloads=decode_payloads)
+
+
+class WorkflowStackRequest(RequestModel):
     """Model for trace_workflow parameters."""
     workflow_id: str = Field(..., min_length=1)
     run_id: Optional[str] = None
@@ -69,15 +116,17 @@ class FieldFilter(BaseModel):
     operator: str = Field(..., min_length=1)
     value: str = Field(..., min_length=1)
 
-    @validator('operator')
-    def validate_operator(cls, v):
+    @field_validator('operator')
+    @classmethod
+    def validate_operator(cls, v: str) -> str:
         valid_operators = ["=", "!=", ">", ">=", "<", "<=", "STARTS_WITH", "IN", "BETWEEN", "IS NULL", "IS NOT NULL"]
         if v not in valid_operators:
             raise ValueError(f"Operator must be one of: {valid_operators}")
         return v
 
-    @validator('field')
-    def validate_field(cls, v):
+    @field_validator('field')
+    @classmethod
+    def validate_field(cls, v: str) -> str:
         valid_fields = [
             "WorkflowId", "WorkflowType", "RunId", "ExecutionStatus", 
             "StartTime", "CloseTime", "ExecutionTime", "BuildIds", 
@@ -94,8 +143,9 @@ class TimeRangeFilter(BaseModel):
     start_time: Union[datetime, str]
     end_time: Union[datetime, str]
 
-    @validator('field')
-    def validate_time_field(cls, v):
+    @field_validator('field')
+    @classmethod
+    def validate_time_field(cls, v: str) -> str:
         valid_time_fields = ["StartTime", "CloseTime", "ExecutionTime"]
         if v not in valid_time_fields:
             raise ValueError(f"Time field must be one of: {valid_time_fields}")
@@ -105,10 +155,11 @@ class TimeRangeFilter(BaseModel):
 class InFilter(BaseModel):
     """Model for IN filters in workflow queries."""
     field: str = Field(..., min_length=1)
-    values: List[str] = Field(..., min_items=1)
+    values: List[str] = Field(..., min_length=1)
 
-    @validator('field')
-    def validate_field(cls, v):
+    @field_validator('field')
+    @classmethod
+    def validate_field(cls, v: str) -> str:
         valid_fields = [
             "WorkflowId", "WorkflowType", "RunId", "ExecutionStatus", 
             "BuildIds", "TaskQueue", "WorkflowTaskStartedEventId"
@@ -125,8 +176,9 @@ class StructuredQuery(BaseModel):
     in_filters: Optional[List[InFilter]] = None
     logical_operator: str = Field(default="AND")
 
-    @validator('logical_operator')
-    def validate_logical_operator(cls, v):
+    @field_validator('logical_operator')
+    @classmethod
+    def validate_logical_operator(cls, v: str) -> str:
         if v not in ["AND", "OR"]:
             raise ValueError("Logical operator must be 'AND' or 'OR'")
         return v
@@ -138,8 +190,9 @@ class QueryBuildRequest(BaseModel):
     raw_conditions: Optional[List[str]] = None
     logical_operator: str = Field(default="AND")
 
-    @validator('logical_operator')
-    def validate_logical_operator(cls, v):
+    @field_validator('logical_operator')
+    @classmethod
+    def validate_logical_operator(cls, v: str) -> str:
         if v not in ["AND", "OR"]:
             raise ValueError("Logical operator must be 'AND' or 'OR'")
         return v
@@ -154,9 +207,10 @@ class EnhancedWorkflowListRequest(BaseModel):
     """Enhanced model for list_workflows with structured query support."""
     query: Optional[str] = None
     structured_query: Optional[StructuredQuery] = None
-    limit: int = Field(default=10, ge=1, le=1000)
+    limit: int = Field(default=10, ge=LIST_LIMIT_MIN, le=LIST_LIMIT_MAX)
 
     @model_validator(mode='before')
+    @classmethod
     def validate_query_options(cls, values):
         if isinstance(values, dict):
             query = values.get('query')
@@ -2,9 +2,15 @@
 
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union, Tuple
 import re
 
+try:
+    import re2 as _regex
+except ImportError:  # pragma: no cover - google-re2 is optional
+    _regex = re
+
 
 class ComparisonOperator(Enum):
     """Supported comparison operators for Temporal list filters."""
@@ -79,6 +85,36 @@ class ExecutionStatus(Enum):
     TIMED_OUT = "TimedOut"
 
 
+# Built-in (non-custom) fields reported by get_supported_fields
+_SUPPORTED_FIELDS = (
+    SupportedField.WORKFLOW_ID.value,
+    SupportedField.WORKFLOW_TYPE.value,
+    SupportedField.RUN_ID.value,
+    SupportedField.EXECUTION_STATUS.value,
+    SupportedField.START_TIME.value,
+    SupportedField.CLOSE_TIME.value,
+    SupportedField.EXECUTION_TIME.value,
+    SupportedField.BUILD_IDS.value,
+    SupportedField.TASK_QUEUE.value,
+    SupportedField.WORKFLOW_TASK_STARTED_EVENT_ID.value,
+)
+_SUPPORTED_OPERATORS = tuple(op.value for op in ComparisonOperator)
+_EXECUTION_STATUSES = tuple(status.value for status in ExecutionStatus)
+
+# Plain dict lookups are cheaper than Enum.value descriptor access on hot paths
+_FIELD_VALUES = {field: field.value for field in SupportedField}
+_OP_VALUES = {op: op.value for op in ComparisonOperator}
+_STATUS_VALUES = {status: status.value for status in ExecutionStatus}
+
+
+# Field names containing anything else must be wrapped in backticks
+_SPECIAL_FIELD_CHARS_RE = re.compile(r'[^a-zA-Z0-9_]')
+
+
+# Single-pass escaping for quoted query values: ' -> '' and \ -> \\
+_ESCAPE_TABLE = str.maketrans({"'": "''", "\\": "\\\\"})
+
+
 # Mapping of commonly used unsupported operators to suggested alternatives
 UNSUPPORTED_OPERATORS = {
     "LIKE": "STARTS_WITH",
@@ -95,12 +131,104 @@ UNSUPPORTED_OPERATORS = {
     "NOT ILIKE": "!=",
 }
 
+# One case-insensitive scan for every unsupported operator and wildcard.
+# Longer alternatives come first; word operators need word boundaries to avoid
+# false positives, symbols match anywhere. Compiled with RE2's linear-time
+# engine when google-re2 is installed (flags are inline so both engines accept it).
+_UNSUPPORTED_RE = _regex.compile(
+    r"(?i)\b(?:NOT LIKE|NOT ILIKE|SIMILAR TO|LIKE|ILIKE|CONTAINS|MATCH|REGEXP|REGEX)\b"
+    r"|!~~|~~|~|%|\*"
+)
+
+# A match also reports the operators it contains (e.g. "NOT LIKE" contains "LIKE")
+_UNSUPPORTED_IMPLIED = {
+    "NOT LIKE": ("LIKE", "NOT LIKE"),
+    "NOT ILIKE": ("ILIKE", "NOT ILIKE"),
+    "~~": ("~", "~~"),
+    "!~~": ("~", "~~", "!~~"),
+}
+
+_WILDCARD_ERRORS = {
+    "%": "Wildcard '%' is not supported. Use 'STARTS_WITH' for prefix matching.",
+    "*": "Wildcard '*' is not supported. Use 'STARTS_WITH' for prefix matching.",
+}
+
+
+_VALID_RESULT: Tuple[bool, Tuple[str, ...]] = (True, ())
+
+
+@lru_cache(maxsize=1024)
+def _validate_query_cached(query: str) -> Tuple[bool, Tuple[str, ...]]:
+    """Validate a non-empty query; pure, so results are memoized per query string."""
+    # Basic validation - check for balanced quotes and parentheses
+    unbalanced_quotes = query.count("'") % 2 != 0
+    unbalanced_parens = query.count("(") != query.count(")")
+    
+    # Note: Temporal supports custom search attributes, so we don't restrict
+    # queries to only core fields. Queries can contain custom attributes only.
+    # Check for unsupported operators and wildcards
+    found = set()
+    for match in _UNSUPPORTED_RE.finditer(query):
+        token = match.group(0).upper()
+        found.update(_UNSUPPORTED_IMPLIED.get(token, (token,)))
+    
+    # Common case: nothing to report, so no error list is built
+    if not (unbalanced_quotes or unbalanced_parens or found):
+        return _VALID_RESULT
+    
+    errors = []
+    if unbalanced_quotes:
+        errors.append("Unbalanced single quotes in query")
+    if unbalanced_parens:
+        errors.append("Unbalanced parentheses in query")
+    for unsupported_op, suggested_op in UNSUPPORTED_OPERATORS.items():
+        if unsupported_op in found:
+            errors.append(f"Unsupported operator '{unsupported_op}'. Use '{suggested_op}' instead.")
+    for wildcard, message in _WILDCARD_ERRORS.items():
+        if wildcard in found:
+            errors.append(message)
+    
+    return False, tuple(errors)
+
+
+class _CombinedCondition:
+    """Deferred ``(left) OP (right)`` condition, rendered only in ``build()``."""
+    __slots__ = ("operator", "left", "right")
+
+    def __init__(self, operator: str, left: tuple, right: tuple):
+        self.operator = operator
+        self.left = left
+        self.right = right
+
+
+def _render_conditions(conditions) -> str:
+    """Flatten AND-joined conditions (including combined ones) into one string.
+    
+    Walks iteratively and joins once at the end, so deeply chained
+    and_condition/or_condition calls cost linear rather than quadratic copying.
+    """
+    parts: List[str] = []
+    stack: list = [conditions]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            parts.append(item)
+        elif isinstance(item, _CombinedCondition):
+            stack.extend((")", item.right, f") {item.operator} (", item.left, "("))
+        else:
+            # Sequence of conditions joined with AND; push in reverse so they pop in order
+            for idx in range(len(item) - 1, -1, -1):
+                stack.append(item[idx])
+                if idx:
+                    stack.append(" AND ")
+    return "".join(parts)
+
 
 class TemporalQueryBuilder:
     """Builder for constructing Temporal workflow list filter queries."""
 
     def __init__(self):
-        self._conditions: List[str] = []
+        self._conditions: List[Union[str, _CombinedCondition]] = []
 
     def workflow_id(self, value: str, operator: ComparisonOperator = ComparisonOperator.EQUALS) -> "TemporalQueryBuilder":
         """Add a WorkflowId filter."""
@@ -112,7 +240,7 @@ class TemporalQueryBuilder:
 
     def execution_status(self, status: Union[ExecutionStatus, str], operator: ComparisonOperator = ComparisonOperator.EQUALS) -> "TemporalQueryBuilder":
         """Add an ExecutionStatus filter."""
-        status_value = status.value if isinstance(status, ExecutionStatus) else status
+        status_value = _STATUS_VALUES[status] if isinstance(status, ExecutionStatus) else status
         return self._add_condition(SupportedField.EXECUTION_STATUS, status_value, operator)
 
     def start_time(self, time: Union[datetime, str], operator: ComparisonOperator = ComparisonOperator.GREATER_THAN) -> "TemporalQueryBuilder":
@@ -159,17 +287,17 @@ class TemporalQueryBuilder:
             value_str = str(value)
         
         # Wrap field name in backticks if it contains special characters
-        if re.search(r'[^a-zA-Z0-9_]', field_name):
+        if _SPECIAL_FIELD_CHARS_RE.search(field_name):
             field_name = f"`{field_name}`"
         
-        condition = f"{field_name} {operator.value} '{self._escape_value(value_str)}'"
+        condition = f"{field_name} {_OP_VALUES[operator]} '{self._escape_value(value_str)}'"
         self._conditions.append(condition)
         return self
 
     def workflow_id_in(self, workflow_ids: List[str]) -> "TemporalQueryBuilder":
         """Add a WorkflowId IN filter."""
         values = ", ".join([f"'{self._escape_value(wid)}'" for wid in workflow_ids])
-        condition = f"{SupportedField.WORKFLOW_ID.value} IN ({values})"
+        condition = f"{_FIELD_VALUES[SupportedField.WORKFLOW_ID]} IN ({values})"
         self._conditions.append(condition)
         return self
 
@@ -181,29 +309,29 @@ class TemporalQueryBuilder:
         """Add an ExecutionStatus IN filter."""
         status_values = []
         for status in statuses:
-            status_values.append(status.value if isinstance(status, ExecutionStatus) else status)
+            status_values.append(_STATUS_VALUES[status] if isinstance(status, ExecutionStatus) else status)
         values = ", ".join([f"'{self._escape_value(status)}'" for status in status_values])
-        condition = f"{SupportedField.EXECUTION_STATUS.value} IN ({values})"
+        condition = f"{_FIELD_VALUES[SupportedField.EXECUTION_STATUS]} IN ({values})"
         self._conditions.append(condition)
         return self
 
     def build_ids_in(self, build_ids: List[str]) -> "TemporalQueryBuilder":
         """Add a BuildIds IN filter for multiple build IDs."""
         values = ", ".join([f"'{self._escape_value(bid)}'" for bid in build_ids])
-        condition = f"{SupportedField.BUILD_IDS.value} IN ({values})"
+        condition = f"{_FIELD_VALUES[SupportedField.BUILD_IDS]} IN ({values})"
         self._conditions.append(condition)
         return self
 
     def is_null(self, field: Union[SupportedField, str]) -> "TemporalQueryBuilder":
         """Add an IS NULL condition for a field."""
-        field_name = field.value if isinstance(field, SupportedField) else field
+        field_name = _FIELD_VALUES[field] if isinstance(field, SupportedField) else field
         condition = f"{field_name} IS NULL"
         self._conditions.append(condition)
         return self
 
     def is_not_null(self, field: Union[SupportedField, str]) -> "TemporalQueryBuilder":
         """Add an IS NOT NULL condition for a field."""
-        field_name = field.value if isinstance(field, SupportedField) else field
+        field_name = _FIELD_VALUES[field] if isinstance(field, SupportedField) else field
         condition = f"{field_name} IS NOT NULL"
         self._conditions.append(condition)
         return self
@@ -216,28 +344,28 @@ class TemporalQueryBuilder:
         start_value = start.isoformat() if isinstance(start, datetime) else start
         end_value = end.isoformat() if isinstance(end, datetime) else end
         
-        condition = f"{field.value} BETWEEN '{self._escape_value(start_value)}' AND '{self._escape_value(end_value)}'"
+        condition = f"{_FIELD_VALUES[field]} BETWEEN '{self._escape_value(start_value)}' AND '{self._escape_value(end_value)}'"
         self._conditions.append(condition)
         return self
 
     def and_condition(self, builder: "TemporalQueryBuilder") -> "TemporalQueryBuilder":
         """Combine with another query using AND."""
         if builder._conditions:
-            other_query = builder.build()
+            other = tuple(builder._conditions)
             if self._conditions:
-                self._conditions = [f"({' AND '.join(self._conditions)}) AND ({other_query})"]
+                self._conditions = [_CombinedCondition("AND", tuple(self._conditions), other)]
             else:
-                self._conditions = [other_query]
+                self._conditions = list(other)
         return self
 
     def or_condition(self, builder: "TemporalQueryBuilder") -> "TemporalQueryBuilder":
         """Combine with another query using OR."""
         if builder._conditions:
-            other_query = builder.build()
+            other = tuple(builder._conditions)
             if self._conditions:
-                self._conditions = [f"({' AND '.join(self._conditions)}) OR ({other_query})"]
+                self._conditions = [_CombinedCondition("OR", tuple(self._conditions), other)]
             else:
-                self._conditions = [other_query]
+                self._conditions = list(other)
         return self
 
     def custom_condition(self, condition: str) -> "TemporalQueryBuilder":
@@ -247,27 +375,31 @@ class TemporalQueryBuilder:
         self._conditions.append(condition.strip())
         return self
 
+    def extend_conditions(self, conditions: List[str]) -> "TemporalQueryBuilder":
+        """Add several custom condition strings at once (use with caution)."""
+        stripped = [condition.strip() for condition in conditions]
+        if not all(stripped):
+            raise ValueError("Custom condition cannot be empty")
+        self._conditions.extend(stripped)
+        return self
+
     def build(self) -> str:
         """Build the final query string."""
         if not self._conditions:
             return ""
-        return " AND ".join(self._conditions)
+        return _render_conditions(self._conditions)
 
     def _add_condition(self, field: SupportedField, value: str, operator: ComparisonOperator) -> "TemporalQueryBuilder":
         """Add a single condition to the query."""
-        escaped_value = self._escape_value(value)
-        
-        if operator == ComparisonOperator.STARTS_WITH:
-            condition = f"{field.value} {operator.value} '{escaped_value}'"
-        else:
-            condition = f"{field.value} {operator.value} '{escaped_value}'"
-        
-        self._conditions.append(condition)
+        # Every operator (including STARTS_WITH) renders as: field op 'value'
+        self._conditions.append(
+            f"{_FIELD_VALUES[field]} {_OP_VALUES[operator]} '{value.translate(_ESCAPE_TABLE)}'"
+        )
         return self
 
     def _escape_value(self, value: str) -> str:
         """Escape special characters in query values."""
-        return value.replace("'", "''").replace("\\", "\\\\")
+        return value.translate(_ESCAPE_TABLE)
 
     @classmethod
     def validate_query(cls, query: str) -> Tuple[bool, List[str]]:
@@ -276,48 +408,12 @@ class TemporalQueryBuilder:
         Returns:
             Tuple of (is_valid, error_messages)
         """
-        if not query or not query.strip():
-            return True, []  # Empty queries are valid
-        
-        errors = []
-        
-        # Basic validation - check for balanced quotes and parentheses
-        single_quotes = query.count("'")
-        if single_quotes % 2 != 0:
-            errors.append("Unbalanced single quotes in query")
-        
-        open_parens = query.count("(")
-        close_parens = query.count(")")
-        if open_parens != close_parens:
-            errors.append("Unbalanced parentheses in query")
-        
-        # Note: Temporal supports custom search attributes, so we don't restrict
-        # queries to only core fields. Queries can contain custom attributes only.
-        # Check for unsupported operators
-        unsupported_found = []
-        for unsupported_op, suggested_op in UNSUPPORTED_OPERATORS.items():
-            # For single character operators, don't use word boundaries
-            if len(unsupported_op) == 1:
-                pattern = re.escape(unsupported_op)
-            else:
-                # Use word boundaries for multi-character operators to avoid false positives
-                pattern = r'\b' + re.escape(unsupported_op) + r'\b'
-            
-            if re.search(pattern, query, re.IGNORECASE):
-                unsupported_found.append((unsupported_op, suggested_op))
-        
-        if unsupported_found:
-            for unsupported_op, suggested_op in unsupported_found:
-                errors.append(f"Unsupported operator '{unsupported_op}'. Use '{suggested_op}' instead.")
-        
-        # Check for other potentially problematic patterns
-        if re.search(r'%', query):
-            errors.append("Wildcard '%' is not supported. Use 'STARTS_WITH' for prefix matching.")
+        # Empty queries are valid; isspace() checks without allocating a stripped copy
+        if not query or query.isspace():
+            return True, []
         
-        if re.search(r'\*', query):
-            errors.append("Wildcard '*' is not supported. Use 'STARTS_WITH' for prefix matching.")
-        
-        return len(errors) == 0, errors
+        is_valid, errors = _validate_query_cached(query)
+        return is_valid, list(errors)
 
     @classmethod
     def get_validation_help(cls, query: str) -> Dict[str, Any]:
@@ -368,18 +464,7 @@ class TemporalQueryBuilder:
         
         Note: Custom search attributes are also supported but not listed here.
         """
-        return [
-            SupportedField.WORKFLOW_ID.value,
-            SupportedField.WORKFLOW_TYPE.value,
-            SupportedField.RUN_ID.value,
-            SupportedField.EXECUTION_STATUS.value,
-            SupportedField.START_TIME.value,
-            SupportedField.CLOSE_TIME.value,
-            SupportedField.EXECUTION_TIME.value,
-            SupportedField.BUILD_IDS.value,
-            SupportedField.TASK_QUEUE.value,
-            SupportedField.WORKFLOW_TASK_STARTED_EVENT_ID.value
-        ]
+        return list(_SUPPORTED_FIELDS)
 
     @classmethod
     def get_all_field_types(cls) -> Dict[str, str]:
@@ -400,7 +485,7 @@ class TemporalQueryBuilder:
     @classmethod
     def get_supported_operators(cls) -> List[str]:
         """Get list of all supported operators."""
-        return [op.value for op in ComparisonOperator]
+        return list(_SUPPORTED_OPERATORS)
 
     @classmethod
     def get_operator_usage(cls) -> Dict[str, str]:
@@ -424,7 +509,7 @@ class TemporalQueryBuilder:
     @classmethod
     def get_execution_statuses(cls) -> List[str]:
         """Get list of all valid execution status values."""
-        return [status.value for status in ExecutionStatus]
+        return list(_EXECUTION_STATUSES)
 
     @classmethod
     def get_data_types_info(cls) -> Dict[str, Dict[str, Any]]:
@@ -1,16 +1,54 @@
-"""Workflow tools registration aggregator."""
-
-from .list import list_workflows, list_workflows_structured  # noqa: F401
-from .describe import describe_workflow  # noqa: F401
-from .start import start_workflow  # noqa: F401
-from .signal import signal_workflow  # noqa: F401
-from .query import query_workflow  # noqa: F401
-from .cancel import cancel_workflow  # noqa: F401
-from .terminate import terminate_workflow  # noqa: F401
-from .history import get_workflow_history  # noqa: F401
-from .build_query import build_workflow_query, get_query_examples, validate_workflow_query  # noqa: F401
-from .count import count_workflows  # noqa: F401
-from .reset import reset_workflow  # noqa: F401
-from .trace import trace_workflow  # noqa: F401
-from .analyze import analyze_workflow_run  # noqa: F401
-from .failed_runs import get_failed_runs  # noqa: F401
+"""Workflow tools registration aggregator.
+
+Tool modules register themselves with the MCP server when imported. They are
+loaded lazily so importing one submodule (or this package) does not pull in
+every tool; the server calls ``register_tools()`` to load them all.
+"""
+
+import importlib
+from typing import Any, List
+
+# Exported tool name -> submodule defining it
+_LAZY = {
+    "list_workflows": ".list",
+    "list_workflows_structured": ".list",
+    "describe_workflow": ".describe",
+    "start_workflow": ".start",
+    "signal_workflow": ".signal",
+    "query_workflow": ".query",
+    "cancel_workflow": ".cancel",
+    "terminate_workflow": ".terminate",
+    "get_workflow_history": ".history",
+    "build_workflow_query": ".build_query",
+    "get_query_examples": ".build_query",
+    "validate_workflow_query": ".build_query",
+    "validate_workflow_queries": ".build_query",
+    "count_workflows": ".count",
+    "reset_workflow": ".reset",
+    "trace_workflow": ".trace",
+    "analyze_workflow_run": ".analyze",
+    "get_failed_runs": ".failed_runs",
+    "get_failed_runs_batch": ".failed_runs",
+}
+
+__all__: List[str] = list(_LAZY)
+
+
+def register_tools() -> None:
+    """Import every tool module so its tools are registered with the server."""
+    for module in dict.fromkeys(_LAZY.values()):
+        importlib.import_module(module, __name__)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
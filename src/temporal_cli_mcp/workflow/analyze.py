@@ -11,8 +11,9 @@ Decision flow for workflow analysis:
 This tool provides deep insights but requires more computation than get_failed_runs().
 """
 
-import json
-from typing import Dict, Any, Optional
+from collections import Counter
+from functools import lru_cache
+from typing import Callable, Dict, Any, Optional, Tuple
 from ..core import mcp, run_temporal_command
 from .failed_runs import get_failed_runs_count_only
 
@@ -59,14 +60,86 @@ async def analyze_workflow_run(
     """
 
 
+def _append_timeline(event: Dict[str, Any], event_type: str, analysis: Dict[str, Any]) -> None:
+    analysis["execution_timeline"].append({
+        "event_id": event.get("eventId"),
+        "event_type": event_type,
+        "event_time": event.get("eventTime")
+    })
+
+
+def _append_child_workflow(event: Dict[str, Any], event_type: str, analysis: Dict[str, Any]) -> None:
+    attrs = event.get("startChildWorkflowExecutionInitiatedEventAttributes", {})
+    analysis["child_workflows"].append({
+        "workflow_id": attrs.get("workflowId"),
+        "workflow_type": attrs.get("workflowType", {}).get("name"),
+        "event_time": event.get("eventTime")
+    })
+
+
+def _append_failure(event: Dict[str, Any], event_type: str, analysis: Dict[str, Any]) -> None:
+    get = event.get
+    analysis["failures"].append({
+        "event_id": get("eventId"),
+        "event_type": event_type,
+        "event_time": get("eventTime"),
+        "details": get("workflowExecutionFailedEventAttributes") or 
+                  get("activityTaskFailedEventAttributes") or 
+                  get("childWorkflowExecutionFailedEventAttributes")
+    })
+
+
+def _append_signal(event: Dict[str, Any], event_type: str, analysis: Dict[str, Any]) -> None:
+    analysis["signals"].append({
+        "event_id": event.get("eventId"),
+        "event_type": event_type,
+        "event_time": event.get("eventTime")
+    })
+
+
+# Key lifecycle events recorded in the execution timeline
+_TIMELINE_EVENTS = frozenset({
+    "EVENT_TYPE_WORKFLOW_EXECUTION_STARTED",
+    "EVENT_TYPE_WORKFLOW_EXECUTION_COMPLETED",
+    "EVENT_TYPE_WORKFLOW_EXECUTION_FAILED",
+    "EVENT_TYPE_WORKFLOW_EXECUTION_TERMINATED",
+})
+
+# Exact event types with a dedicated handler
+_DISPATCH = {
+    **dict.fromkeys(_TIMELINE_EVENTS, _append_timeline),
+    "EVENT_TYPE_START_CHILD_WORKFLOW_EXECUTION_INITIATED": _append_child_workflow,
+}
+
+
+@lru_cache(maxsize=256)
+def _event_handlers(event_type: str) -> Tuple[Callable[..., None], ...]:
+    """Resolve the handlers for an event type, in the order results are recorded.
+    
+    Histories contain only a few dozen distinct event types, so the substring
+    checks run once per type rather than once per event.
+    """
+    handlers = []
+    exact = _DISPATCH.get(event_type)
+    if exact is not None:
+        handlers.append(exact)
+    if "FAILED" in event_type:
+        handlers.append(_append_failure)
+    if "SIGNAL" in event_type:
+        handlers.append(_append_signal)
+    return tuple(handlers)
+
+
 def _analyze_execution_history(events: list) -> Dict[str, Any]:
     """Analyze execution history events for patterns."""
     if not events:
         return {}
     
+    event_types = [event.get("eventType", "UNKNOWN") for event in events]
+    
     analysis = {
         "total_events": len(events),
-        "event_types": {},
+        "event_types": dict(Counter(event_types)),
         "execution_timeline": [],
         "child_workflows": [],
         "failures": [],
@@ -74,138 +147,107 @@ def _analyze_execution_history(events: list) -> Dict[str, Any]:
         "activities": []
     }
     
-    # Count event types
-    for event in events:
-        event_type = event.get("eventType", "UNKNOWN")
-        analysis["event_types"][event_type] = analysis["event_types"].get(event_type, 0) + 1
-        
-        # Extract key timeline events
-        if event_type in ["EVENT_TYPE_WORKFLOW_EXECUTION_STARTED", "EVENT_TYPE_WORKFLOW_EXECUTION_COMPLETED", 
-                         "EVENT_TYPE_WORKFLOW_EXECUTION_FAILED", "EVENT_TYPE_WORKFLOW_EXECUTION_TERMINATED"]:
-            analysis["execution_timeline"].append({
-                "event_id": event.get("eventId"),
-                "event_type": event_type,
-                "event_time": event.get("eventTime")
-            })
-        
-        # Track child workflows
-        if event_type == "EVENT_TYPE_START_CHILD_WORKFLOW_EXECUTION_INITIATED":
-            attrs = event.get("startChildWorkflowExecutionInitiatedEventAttributes", {})
-            analysis["child_workflows"].append({
-                "workflow_id": attrs.get("workflowId"),
-                "workflow_type": attrs.get("workflowType", {}).get("name"),
-                "event_time": event.get("eventTime")
-            })
-        
-        # Track failures
-        if "FAILED" in event_type:
-            analysis["failures"].append({
-                "event_id": event.get("eventId"),
-                "event_type": event_type,
-                "event_time": event.get("eventTime"),
-                "details": event.get("workflowExecutionFailedEventAttributes") or 
-                          event.get("activityTaskFailedEventAttributes") or 
-                          event.get("childWorkflowExecutionFailedEventAttributes")
-            })
-        
-        # Track signals
-        if "SIGNAL" in event_type:
-            analysis["signals"].append({
-                "event_id": event.get("eventId"),
-                "event_type": event_type,
-                "event_time": event.get("eventTime")
-            })
+    # Single pass: each event only visits the handlers for its type
+    handlers_for = _event_handlers
+    for event, event_type in zip(events, event_types):
+        for handler in handlers_for(event_type):
+            handler(event, event_type, analysis)
     
     return analysis
 
 
+# Failure pattern thresholds
+_RETRY_STORM_THRESHOLD = 50
+_TIMEOUT_HISTORY_LEN = 47
+_TIMEOUT_FAILED_THRESHOLD = 10
+_CORRUPTION_FAILED_THRESHOLD = 20
+_INVESTIGATE_FAILED_THRESHOLD = 10
+
+
 def _identify_failure_patterns(analysis: Dict[str, Any]) -> Dict[str, Any]:
     """Identify common failure patterns from the analysis."""
+    descriptions = []
     patterns = {
         "is_retry_storm": False,
         "has_child_workflow_failures": False,
         "has_timeout_pattern": False,
         "has_data_corruption": False,
-        "pattern_description": []
+        "pattern_description": descriptions
     }
     
     retry_stats = analysis.get("retry_statistics", {})
+    failed = retry_stats.get("failed_attempts", 0)
     
     # Retry storm detection
-    if retry_stats.get("failed_attempts", 0) > 50:
+    if failed > _RETRY_STORM_THRESHOLD:
         patterns["is_retry_storm"] = True
-        patterns["pattern_description"].append("RETRY STORM: Excessive retry attempts detected")
+        descriptions.append("RETRY STORM: Excessive retry attempts detected")
     
     # Child workflow failure pattern
     exec_analysis = analysis.get("execution_analysis", {})
     if exec_analysis.get("failures"):
         patterns["has_child_workflow_failures"] = True
-        patterns["pattern_description"].append("Child workflow failures detected")
+        descriptions.append("Child workflow failures detected")
+    
+    # Remaining patterns all require more failures than the smallest threshold
+    if failed <= _TIMEOUT_FAILED_THRESHOLD:
+        return patterns
     
     # Timeout pattern (consistent execution duration)
     current_status = analysis.get("current_status", {})
-    if current_status.get("history_length") == 47 and retry_stats.get("failed_attempts", 0) > 10:
+    if current_status.get("history_length") == _TIMEOUT_HISTORY_LEN:
         patterns["has_timeout_pattern"] = True
-        patterns["pattern_description"].append("Consistent timeout pattern (17min executions)")
+        descriptions.append("Consistent timeout pattern (17min executions)")
     
     # Data corruption/schema mismatch
-    if retry_stats.get("failed_attempts", 0) > 20 and retry_stats.get("successful_attempts", 0) == 0:
+    if failed > _CORRUPTION_FAILED_THRESHOLD and retry_stats.get("successful_attempts", 0) == 0:
         patterns["has_data_corruption"] = True
-        patterns["pattern_description"].append("Possible data schema mismatch or corruption")
+        descriptions.append("Possible data schema mismatch or corruption")
     
     return patterns
 
 
+# (failure pattern flag, failed_attempts threshold, priority, action,
+#  description template, suggested command template); a rule fires when its
+#  flag is set in failure_patterns or failed_attempts exceeds its threshold.
+_RECOMMENDATION_RULES = (
+    (
+        "is_retry_storm", None, "CRITICAL", "IMMEDIATE_INTERVENTION",
+        "Stop retry storm: {failed_attempts} failed attempts",
+        "temporal workflow terminate --workflow-id {workflow_id} --reason 'Stopping retry storm'",
+    ),
+    (
+        "has_timeout_pattern", None, "HIGH", "RESET_WORKFLOW",
+        "Reset workflow to earlier successful state",
+        "temporal workflow reset --workflow-id {workflow_id} --reason 'Breaking timeout pattern'",
+    ),
+    (
+        "has_data_corruption", None, "HIGH", "DATA_INVESTIGATION",
+        "Investigate data schema compatibility issues",
+        "temporal workflow show --workflow-id {workflow_id} | jq '.events[-5:].[] | select(.eventType | contains(\"FAILED\"))'",
+    ),
+    (
+        None, _INVESTIGATE_FAILED_THRESHOLD, "MEDIUM", "INVESTIGATE_ROOT_CAUSE",
+        "Analyze failure details for root cause",
+        "temporal workflow list --query \"WorkflowId = '{workflow_id}' AND ExecutionStatus = 'Failed'\" --limit 5",
+    ),
+)
+
+
 def _generate_recommendations(analysis: Dict[str, Any]) -> list:
     """Generate actionable recommendations based on analysis."""
-    recommendations = []
-    
     retry_stats = analysis.get("retry_statistics", {})
     failure_patterns = analysis.get("failure_patterns", {})
-    current_status = analysis.get("current_status", {})
-    
-    # Critical retry storm
-    if failure_patterns.get("is_retry_storm"):
-        recommendations.append({
-            "priority": "CRITICAL",
-            "action": "IMMEDIATE_INTERVENTION",
-            "description": f"Stop retry storm: {retry_stats.get('failed_attempts')} failed attempts",
-            "suggested_commands": [
-                f"temporal workflow terminate --workflow-id {analysis['workflow_id']} --reason 'Stopping retry storm'"
-            ]
-        })
-    
-    # Timeout pattern
-    if failure_patterns.get("has_timeout_pattern"):
-        recommendations.append({
-            "priority": "HIGH", 
-            "action": "RESET_WORKFLOW",
-            "description": "Reset workflow to earlier successful state",
-            "suggested_commands": [
-                f"temporal workflow reset --workflow-id {analysis['workflow_id']} --reason 'Breaking timeout pattern'"
-            ]
-        })
-    
-    # Data corruption
-    if failure_patterns.get("has_data_corruption"):
-        recommendations.append({
-            "priority": "HIGH",
-            "action": "DATA_INVESTIGATION", 
-            "description": "Investigate data schema compatibility issues",
-            "suggested_commands": [
-                f"temporal workflow show --workflow-id {analysis['workflow_id']} | jq '.events[-5:].[] | select(.eventType | contains(\"FAILED\"))'"
-            ]
-        })
-    
-    # Long-running investigation
-    if retry_stats.get("failed_attempts", 0) > 10:
-        recommendations.append({
-            "priority": "MEDIUM",
-            "action": "INVESTIGATE_ROOT_CAUSE",
-            "description": "Analyze failure details for root cause",
-            "suggested_commands": [
-                f"temporal workflow list --query \"WorkflowId = '{analysis['workflow_id']}' AND ExecutionStatus = 'Failed'\" --limit 5"
-            ]
-        })
-    
-    return recommendations
\ No newline at end of file
+    failed = retry_stats.get("failed_attempts", 0)
+    
+    return [
+        {
+            "priority": priority,
+            "action": action,
+            "description": description.format(failed_attempts=retry_stats.get("failed_attempts")),
+            "suggested_commands": [command.format(workflow_id=analysis["workflow_id"])]
+        }
+        for flag, threshold, priority, action, description, command in _RECOMMENDATION_RULES
+        if (flag is not None and failure_patterns.get(flag))
+        or (threshold is not None and failed > threshold)
+    ]
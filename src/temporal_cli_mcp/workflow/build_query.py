@@ -1,8 +1,122 @@
 """MCP tool for building Temporal workflow queries."""
 
-from typing import Any, Dict
+import copy
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Tuple
+
+from pydantic import ValidationError as PydanticValidationError
 
 from ..core import mcp
+from ..query_builder import TemporalQueryBuilder
+
+
+# Capitalized identifiers (possible field names), found in one regex scan;
+# quotes and backticks around names are not part of the match
+_FIELD_CANDIDATE_RE = re.compile(r"(?<!\w)[A-Z]\w*")
+_BUILTIN_FIELDS = frozenset(TemporalQueryBuilder.get_supported_fields())
+
+# Operator tokens probed by validate_workflow_query
+_QUOTED_VALUE_OPERATORS = ("=", "!=", "STARTS_WITH")
+_OPERATOR_TOKENS = ("=", "!=", ">", "<", "STARTS_WITH")
+
+
+@lru_cache(maxsize=512)
+def _cached_validation_help(query: str) -> Mapping[str, Any]:
+    """Validation help is pure over the query text; cache it read-only.
+    
+    Lists are stored as tuples so a returned copy cannot corrupt the cache entry.
+    """
+    validation_help = TemporalQueryBuilder.get_validation_help(query)
+    return MappingProxyType({
+        key: tuple(value) if isinstance(value, list) else value
+        for key, value in validation_help.items()
+    })
+
+
+def _structured_shape(sq: Any) -> Tuple[tuple, List[str]]:
+    """Split a StructuredQuery into its shape (fields/operators) and its values."""
+    shape = []
+    values: List[str] = []
+    
+    # Field filters
+    for field_filter in sq.field_filters or ():
+        shape.append(("field", field_filter.field, field_filter.operator))
+        values.append(field_filter.value)
+    
+    # Time range filters
+    for time_filter in sq.time_range_filters or ():
+        start_time = time_filter.start_time
+        end_time = time_filter.end_time
+        
+        # Convert datetime to string if needed
+        if isinstance(start_time, (datetime, date)):
+            start_time = start_time.isoformat()
+        if isinstance(end_time, (datetime, date)):
+            end_time = end_time.isoformat()
+        
+        shape.append(("time", time_filter.field))
+        values.extend((start_time, end_time))
+    
+    # IN filters
+    for in_filter in sq.in_filters or ():
+        shape.append(("in", in_filter.field, len(in_filter.values)))
+        values.extend(in_filter.values)
+    
+    return tuple(shape), values
+
+
+@lru_cache(maxsize=256)
+def _template_for(shape: tuple) -> str:
+    """Build a str.format template for a query shape, with one hole per value.
+    
+    Field names and operators are validated against fixed lists by the request
+    models, so they never contain format braces.
+    """
+    conditions = []
+    for kind, field, *rest in shape:
+        if kind == "field":
+            conditions.append(f"{field} {rest[0]} '{{}}'")
+        elif kind == "time":
+            conditions.append(f"{field} BETWEEN '{{}}' AND '{{}}'")
+        else:
+            holes = ", ".join(["'{}'"] * rest[0])
+            conditions.append(f"{field} IN ({holes})")
+    return " AND ".join(conditions)
+
+
+_NON_PAREN_RE = re.compile(r"[^()]+")
+
+
+def _parens_balanced(query: str, open_parens: int, close_parens: int) -> bool:
+    """Whether parentheses pair up in order (no ')' before its matching '(')."""
+    if open_parens != close_parens:
+        return False
+    if not open_parens:
+        return True
+    parens = _NON_PAREN_RE.sub("", query)
+    while "()" in parens:
+        parens = parens.replace("()", "")
+    return not parens
+
+
+@lru_cache(maxsize=512)
+def _scan_query(query: str) -> Tuple[int, bool, bool, bool]:
+    """Collect (quotes, parens_balanced, has_and, has_or) for a query.
+    
+    The logical operator checks are case-insensitive. Each check is a C-level
+    string scan and the query is lowercased only once. Results are cached, as
+    the same candidate query is often validated repeatedly.
+    """
+    lowered = query.lower()
+    return (
+        query.count("'"),
+        _parens_balanced(query, query.count("("), query.count(")")),
+        " and " in lowered,
+        " or " in lowered,
+    )
 
 
 @mcp.tool()
@@ -20,7 +134,7 @@ async def build_workflow_query(
     Returns a dictionary with the built query string and validation info.
     """
     from ..models import QueryBuildRequest, StructuredQuery
-    from ..query_builder import TemporalQueryBuilder, create_query_builder
+    from ..query_builder import create_query_builder
     from ..exceptions import ValidationError
     
     try:
@@ -36,52 +150,20 @@ async def build_workflow_query(
             logical_operator=logical_operator
         )
         
-        builder = create_query_builder()
-        
-        # Handle structured query
+        # Handle structured query: same-shaped queries share one cached template
         if request.structured_query:
-            sq = request.structured_query
-            
-            # Add field filters
-            if sq.field_filters:
-                for field_filter in sq.field_filters:
-                    builder.custom_condition(
-                        f"{field_filter.field} {field_filter.operator} '{field_filter.value}'"
-                    )
-            
-            # Add time range filters
-            if sq.time_range_filters:
-                for time_filter in sq.time_range_filters:
-                    start_time = time_filter.start_time
-                    end_time = time_filter.end_time
-                    
-                    # Convert datetime to string if needed
-                    if hasattr(start_time, 'isoformat'):
-                        start_time = start_time.isoformat()
-                    if hasattr(end_time, 'isoformat'):
-                        end_time = end_time.isoformat()
-                    
-                    builder.custom_condition(
-                        f"{time_filter.field} BETWEEN '{start_time}' AND '{end_time}'"
-                    )
-            
-            # Add IN filters
-            if sq.in_filters:
-                for in_filter in sq.in_filters:
-                    values_str = ", ".join([f"'{value}'" for value in in_filter.values])
-                    builder.custom_condition(f"{in_filter.field} IN ({values_str})")
+            shape, values = _structured_shape(request.structured_query)
+            query_string = _template_for(shape).format(*values)
         
         # Handle raw conditions
-        elif request.raw_conditions:
-            for condition in request.raw_conditions:
-                builder.custom_condition(condition)
-        
-        # Build the final query
-        query_string = builder.build()
+        else:
+            builder = create_query_builder().extend_conditions(request.raw_conditions or ())
+            query_string = builder.build()
         
-        # Validate the built query
-        is_valid, validation_errors = TemporalQueryBuilder.validate_query(query_string)
-        validation_details = TemporalQueryBuilder.get_validation_help(query_string)
+        # Validate the built query (the help result already carries validity and errors)
+        validation_details = dict(_cached_validation_help(query_string))
+        is_valid = validation_details["is_valid"]
+        validation_errors = list(validation_details["errors"])
         
         return {
             "success": True,
@@ -94,9 +176,9 @@ async def build_workflow_query(
             "execution_statuses": TemporalQueryBuilder.get_execution_statuses()
         }
         
+    except PydanticValidationError as e:
+        raise ValidationError(f"Invalid query input: {e}") from e
     except Exception as e:
-        if "ValidationError" in str(type(e)):
-            raise ValidationError(f"Invalid query input: {e}")
         return {
             "success": False,
             "error": str(e),
@@ -105,6 +187,88 @@ async def build_workflow_query(
         }
 
 
+# Example payload is static, so it is built once at import time; each call
+# returns a deep copy so callers never share (or mutate) the module-level dicts.
+
+_EXAMPLES: Dict[str, Dict[str, str]] = {
+    "basic_filters": {
+        "workflow_type": "WorkflowType = 'MyWorkflow'",
+        "execution_status": "ExecutionStatus = 'Running'",
+        "workflow_id": "WorkflowId = 'workflow-123'"
+    },
+    "pattern_matching": {
+        "workflow_name_prefix": "WorkflowType STARTS_WITH 'Patient'",
+        "onboarding_workflows": "WorkflowType STARTS_WITH 'onboard'",
+        "service_workflows": "WorkflowType STARTS_WITH 'service-'"
+    },
+    "comparison_filters": {
+        "recent_workflows": "StartTime > '2024-01-01T00:00:00Z'",
+        "completed_before": "CloseTime < '2024-12-31T23:59:59Z'",
+        "long_running": "ExecutionTime > '2024-01-01T00:00:00Z'"
+    },
+    "advanced_filters": {
+        "workflow_id_list": "WorkflowId IN ('wf-1', 'wf-2', 'wf-3')",
+        "multiple_types": "WorkflowType IN ('OnboardingFlow', 'UserRegistration', 'OrderProcessing')",
+        "time_range": "StartTime BETWEEN '2024-01-01T00:00:00Z' AND '2024-01-31T23:59:59Z'"
+    },
+    "combined_filters": {
+        "running_recent": "ExecutionStatus = 'Running' AND StartTime > '2024-01-01T00:00:00Z'",
+        "failed_or_canceled": "ExecutionStatus = 'Failed' OR ExecutionStatus = 'Canceled'",
+        "failed_onboarding": "WorkflowType STARTS_WITH 'patient' AND ExecutionStatus = 'Failed'",
+        "complex": "(WorkflowType STARTS_WITH 'MyApp' AND ExecutionStatus = 'Running') OR (WorkflowType = 'CriticalWorkflow' AND ExecutionStatus != 'Failed')"
+    }
+}
+
+_COMMON_MISTAKES: Dict[str, Dict[str, str]] = {
+    "avoid_like_operator": {
+        "wrong": "WorkflowType LIKE '%onboard%'",
+        "correct": "WorkflowType STARTS_WITH 'onboard'",
+        "explanation": "LIKE operator is not supported. Use STARTS_WITH for prefix matching."
+    },
+    "avoid_wildcards": {
+        "wrong": "WorkflowType = '*onboard*'",
+        "correct": "WorkflowType STARTS_WITH 'onboard'",
+        "explanation": "Wildcards are not supported. Use STARTS_WITH for prefix matching."
+    },
+    "multiple_values": {
+        "wrong": "WorkflowType = 'Type1' OR WorkflowType = 'Type2' OR WorkflowType = 'Type3'",
+        "correct": "WorkflowType IN ('Type1', 'Type2', 'Type3')",
+        "explanation": "Use IN operator for multiple values instead of chaining OR conditions."
+    },
+    "case_sensitivity": {
+        "wrong": "workflowtype = 'MyWorkflow'",
+        "correct": "WorkflowType = 'MyWorkflow'",
+        "explanation": "Field names are case-sensitive. Use exact field names."
+    }
+}
+
+_EXAMPLES_RESPONSE: Dict[str, Any] = {
+    "success": True,
+    "examples": _EXAMPLES,
+    "common_mistakes": _COMMON_MISTAKES,
+    "usage_notes": (
+        "String values must be enclosed in single quotes",
+        "Time values should be in ISO format (e.g., '2024-01-01T00:00:00Z')",
+        "Use parentheses to group complex logical conditions",
+        "Field names are case-sensitive",
+        "STARTS_WITH is useful for prefix matching on WorkflowType",
+        "Use IN operator for multiple values instead of chaining OR conditions",
+        "LIKE operator and wildcards (%, *) are not supported"
+    ),
+    "supported_fields": (
+        "WorkflowId", "WorkflowType", "ExecutionStatus", 
+        "StartTime", "CloseTime", "ExecutionTime"
+    ),
+    "supported_operators": (
+        "=", "!=", ">", ">=", "<", "<=", "IN", "BETWEEN", "STARTS_WITH", "AND", "OR"
+    ),
+    "supported_statuses": (
+        "Running", "Completed", "Failed", "Canceled", 
+        "Terminated", "ContinuedAsNew", "TimedOut"
+    )
+}
+
+
 @mcp.tool()
 async def get_query_examples() -> Dict[str, Any]:
     """Get example Temporal workflow list filter queries for common use cases.
@@ -112,83 +276,7 @@ async def get_query_examples() -> Dict[str, Any]:
     Returns a collection of example queries demonstrating different filter types
     and combinations that can be used with the list_workflows command.
     """
-    examples = {
-        "basic_filters": {
-            "workflow_type": "WorkflowType = 'MyWorkflow'",
-            "execution_status": "ExecutionStatus = 'Running'",
-            "workflow_id": "WorkflowId = 'workflow-123'"
-        },
-        "pattern_matching": {
-            "workflow_name_prefix": "WorkflowType STARTS_WITH 'Patient'",
-            "onboarding_workflows": "WorkflowType STARTS_WITH 'onboard'",
-            "service_workflows": "WorkflowType STARTS_WITH 'service-'"
-        },
-        "comparison_filters": {
-            "recent_workflows": "StartTime > '2024-01-01T00:00:00Z'",
-            "completed_before": "CloseTime < '2024-12-31T23:59:59Z'",
-            "long_running": "ExecutionTime > '2024-01-01T00:00:00Z'"
-        },
-        "advanced_filters": {
-            "workflow_id_list": "WorkflowId IN ('wf-1', 'wf-2', 'wf-3')",
-            "multiple_types": "WorkflowType IN ('OnboardingFlow', 'UserRegistration', 'OrderProcessing')",
-            "time_range": "StartTime BETWEEN '2024-01-01T00:00:00Z' AND '2024-01-31T23:59:59Z'"
-        },
-        "combined_filters": {
-            "running_recent": "ExecutionStatus = 'Running' AND StartTime > '2024-01-01T00:00:00Z'",
-            "failed_or_canceled": "ExecutionStatus = 'Failed' OR ExecutionStatus = 'Canceled'",
-            "failed_onboarding": "WorkflowType STARTS_WITH 'patient' AND ExecutionStatus = 'Failed'",
-            "complex": "(WorkflowType STARTS_WITH 'MyApp' AND ExecutionStatus = 'Running') OR (WorkflowType = 'CriticalWorkflow' AND ExecutionStatus != 'Failed')"
-        }
-    }
-    
-    common_mistakes = {
-        "avoid_like_operator": {
-            "wrong": "WorkflowType LIKE '%onboard%'",
-            "correct": "WorkflowType STARTS_WITH 'onboard'",
-            "explanation": "LIKE operator is not supported. Use STARTS_WITH for prefix matching."
-        },
-        "avoid_wildcards": {
-            "wrong": "WorkflowType = '*onboard*'",
-            "correct": "WorkflowType STARTS_WITH 'onboard'",
-            "explanation": "Wildcards are not supported. Use STARTS_WITH for prefix matching."
-        },
-        "multiple_values": {
-            "wrong": "WorkflowType = 'Type1' OR WorkflowType = 'Type2' OR WorkflowType = 'Type3'",
-            "correct": "WorkflowType IN ('Type1', 'Type2', 'Type3')",
-            "explanation": "Use IN operator for multiple values instead of chaining OR conditions."
-        },
-        "case_sensitivity": {
-            "wrong": "workflowtype = 'MyWorkflow'",
-            "correct": "WorkflowType = 'MyWorkflow'",
-            "explanation": "Field names are case-sensitive. Use exact field names."
-        }
-    }
-    
-    return {
-        "success": True,
-        "examples": examples,
-        "common_mistakes": common_mistakes,
-        "usage_notes": [
-            "String values must be enclosed in single quotes",
-            "Time values should be in ISO format (e.g., '2024-01-01T00:00:00Z')",
-            "Use parentheses to group complex logical conditions",
-            "Field names are case-sensitive",
-            "STARTS_WITH is useful for prefix matching on WorkflowType",
-            "Use IN operator for multiple values instead of chaining OR conditions",
-            "LIKE operator and wildcards (%, *) are not supported"
-        ],
-        "supported_fields": [
-            "WorkflowId", "WorkflowType", "ExecutionStatus", 
-            "StartTime", "CloseTime", "ExecutionTime"
-        ],
-        "supported_operators": [
-            "=", "!=", ">", ">=", "<", "<=", "IN", "BETWEEN", "STARTS_WITH", "AND", "OR"
-        ],
-        "supported_statuses": [
-            "Running", "Completed", "Failed", "Canceled", 
-            "Terminated", "ContinuedAsNew", "TimedOut"
-        ]
-    }
+    return copy.deepcopy(_EXAMPLES_RESPONSE)
 
 
 @mcp.tool()
@@ -205,21 +293,14 @@ async def validate_workflow_query(query: str) -> Dict[str, Any]:
         Dictionary with validation results and suggestions
     """
     from ..models import QueryValidationRequest
-    from ..query_builder import TemporalQueryBuilder
     from ..exceptions import ValidationError
     
     try:
         # Validate input
         request = QueryValidationRequest(query=query)
         
-        # Perform validation
-        is_valid = TemporalQueryBuilder.validate_query(request.query)
-        
-        # Additional checks
-        validation_issues = []
-        suggestions = []
-        
-        if not request.query.strip():
+        # Blank queries need no scanning at all
+        if request.query.isspace():
             return {
                 "success": True,
                 "is_valid": True,
@@ -229,33 +310,41 @@ async def validate_workflow_query(query: str) -> Dict[str, Any]:
                 "suggestions": []
             }
         
+        # Perform validation
+        is_valid, errors = TemporalQueryBuilder.validate_query(request.query)
+        
+        # Additional checks; unbalanced quotes/parentheses are reported below
+        validation_issues = [error for error in errors if not error.startswith("Unbalanced")]
+        suggestions = []
+        
         # Check for common issues
-        if "'" not in request.query and any(op in request.query for op in ["=", "!=", "STARTS_WITH"]):
+        if "'" not in request.query and any(op in request.query for op in _QUOTED_VALUE_OPERATORS):
             validation_issues.append("String values should be enclosed in single quotes")
             suggestions.append("Example: WorkflowType = 'MyWorkflow' instead of WorkflowType = MyWorkflow")
         
-        if request.query.count("'") % 2 != 0:
+        quotes, parens_balanced, has_lower_and, has_lower_or = _scan_query(request.query)
+        
+        unbalanced_quotes = quotes % 2 != 0
+        if unbalanced_quotes:
             validation_issues.append("Unbalanced single quotes")
             suggestions.append("Ensure all string values are properly quoted")
         
-        if request.query.count("(") != request.query.count(")"):
+        if not parens_balanced:
             validation_issues.append("Unbalanced parentheses")
             suggestions.append("Check that all opening parentheses have matching closing ones")
         
         # Check for potentially unrecognized fields (note: custom search attributes are supported)
         supported_fields = TemporalQueryBuilder.get_supported_fields()
-        query_upper = request.query.upper()
         unrecognized_fields = []
         
-        # Simple field detection (could be more sophisticated)
-        words = request.query.split()
-        for word in words:
-            # Clean up field name (remove backticks, quotes, etc.)
-            clean_word = word.strip('`').strip('"').strip("'")
-            if clean_word and clean_word[0].isupper() and clean_word not in supported_fields:
-                # Might be a field name
-                if any(op in request.query for op in ["=", "!=", ">", "<", "STARTS_WITH"]):
-                    unrecognized_fields.append(clean_word)
+        # Simple field detection (could be more sophisticated); only capitalized
+        # identifiers in a query with a comparison operator can be field names.
+        # With unbalanced quotes, values and names cannot be told apart, so skip it.
+        if not unbalanced_quotes and any(op in request.query for op in _OPERATOR_TOKENS):
+            unrecognized_fields = [
+                name for name in dict.fromkeys(_FIELD_CANDIDATE_RE.findall(request.query))
+                if name not in _BUILTIN_FIELDS
+            ]
         
         if unrecognized_fields:
             # This is just informational, not an error - could be custom search attributes
@@ -263,11 +352,11 @@ async def validate_workflow_query(query: str) -> Dict[str, Any]:
             suggestions.append(f"Built-in fields: {supported_fields}")
         
         # Check for logical operators
-        if " and " in request.query.lower():
+        if has_lower_and:
             validation_issues.append("Logical operators should be uppercase")
             suggestions.append("Use 'AND' instead of 'and'")
         
-        if " or " in request.query.lower():
+        if has_lower_or:
             validation_issues.append("Logical operators should be uppercase")
             suggestions.append("Use 'OR' instead of 'or'")
         
@@ -282,9 +371,9 @@ async def validate_workflow_query(query: str) -> Dict[str, Any]:
             "execution_statuses": TemporalQueryBuilder.get_execution_statuses()
         }
         
+    except PydanticValidationError as e:
+        raise ValidationError(f"Invalid input: {e}") from e
     except Exception as e:
-        if "ValidationError" in str(type(e)):
-            raise ValidationError(f"Invalid input: {e}")
         return {
             "success": False,
             "is_valid": False,
@@ -292,4 +381,44 @@ async def validate_workflow_query(query: str) -> Dict[str, Any]:
             "error": str(e),
             "issues": ["Failed to validate query"],
             "suggestions": ["Check query syntax and try again"]
-        }
\ No newline at end of file
+        }
+
+
+@mcp.tool()
+async def validate_workflow_queries(queries: List[str]) -> Dict[str, Any]:
+    """Validate several Temporal workflow list filter query strings at once.
+    
+    Each query gets the same checks as validate_workflow_query. Duplicate
+    queries are validated once and the result is repeated for each occurrence.
+    
+    Args:
+        queries: The query strings to validate
+        
+    Returns:
+        Dictionary with keys: success, results (one entry per query, in order)
+    """
+    from ..exceptions import ValidationError
+    
+    validated: Dict[str, Dict[str, Any]] = {}
+    for query in dict.fromkeys(queries):
+        try:
+            validated[query] = await validate_workflow_query(query)
+        except ValidationError as e:
+            cause = e.__cause__
+            if isinstance(cause, PydanticValidationError):
+                messages = [error["msg"] for error in cause.errors()]
+            else:
+                messages = [str(e)]
+            validated[query] = {
+                "success": False,
+                "is_valid": False,
+                "query": query,
+                "error": str(e),
+                "issues": ["Invalid query input"],
+                "suggestions": messages
+            }
+    
+    return {
+        "success": True,
+        "results": [dict(validated[query]) for query in queries]
+    }
\ No newline at end of file
@@ -1,6 +1,13 @@
 from typing import Any, Dict, Optional
 
 from ..core import mcp, run_temporal_command
+from ..workflow_fallback import try_workflowid_fallback
+
+
+async def _count_executor(fallback_query: str) -> Dict[str, Any]:
+    """Run the WorkflowId fallback count query."""
+    fallback_args = ["workflow", "count", "--query", fallback_query]
+    return await run_temporal_command(fallback_args, output="json")
 
 
 @mcp.tool()
@@ -31,19 +38,18 @@ async def count_workflows(
     """
     args = ["workflow", "count"]
     if query:
-        args.extend(["--query", query])
+        args.extend(("--query", query))
     
     result = await run_temporal_command(args, output="json")
     
     # Try WorkflowId fallback if no results found
-    from ..workflow_fallback import try_workflowid_fallback
-    
-    async def executor_func(fallback_query: str) -> Dict[str, Any]:
-        fallback_args = ["workflow", "count", "--query", fallback_query]
-        return await run_temporal_command(fallback_args, output="json")
-    
     result, fallback_used = await try_workflowid_fallback(
-        result, query, executor_func
+        result, query, _count_executor
     )
     
-    return result
\ No newline at end of file
+    return result
+
+
+__all__ = [
+    "count_workflows",
+]
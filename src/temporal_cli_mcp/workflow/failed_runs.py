@@ -6,16 +6,50 @@ Notes:
 - Returns just the count for quick retry assessment; use analysis tools for deep dives.
 """
 
-from typing import Dict, Any
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Tuple
 from ..core import mcp, run_temporal_command
 
 
-async def _failed_runs_count_and_query(workflow_id: str) -> tuple[int, str]:
-    """Internal helper to compute failed runs count and the query used."""
-    query = f"WorkflowId = '{workflow_id}' AND ExecutionStatus = 'Failed'"
+# Batch/retry-storm analysis asks about the same workflow repeatedly within
+# seconds; successful counts are reused for a short TTL (bounded LRU), and
+# concurrent lookups of one workflow share a single CLI call.
+_FAILED_COUNT_TTL = 15.0
+_FAILED_COUNT_CACHE_SIZE = 1024
+_failed_count_cache: "OrderedDict[str, Tuple[float, int]]" = OrderedDict()
+_failed_count_inflight: Dict[str, "asyncio.Future[int]"] = {}
+
+
+async def _fetch_failed_count(workflow_id: str, query: str) -> int:
+    """Run the CLI count query and cache successful results."""
     args = ["workflow", "count", "--query", query]
     result = await run_temporal_command(args, output="json")
     count = int(result.get("data", {}).get("count", 0))
+    if result.get("success"):
+        _failed_count_cache[workflow_id] = (time.monotonic(), count)
+        _failed_count_cache.move_to_end(workflow_id)
+        if len(_failed_count_cache) > _FAILED_COUNT_CACHE_SIZE:
+            _failed_count_cache.popitem(last=False)
+    return count
+
+
+async def _failed_runs_count_and_query(workflow_id: str) -> tuple[int, str]:
+    """Internal helper to compute failed runs count and the query used."""
+    query = f"WorkflowId = '{workflow_id}' AND ExecutionStatus = 'Failed'"
+    
+    cached = _failed_count_cache.get(workflow_id)
+    if cached is not None and time.monotonic() - cached[0] < _FAILED_COUNT_TTL:
+        return cached[1], query
+    
+    future = _failed_count_inflight.get(workflow_id)
+    if future is None:
+        future = asyncio.ensure_future(_fetch_failed_count(workflow_id, query))
+        _failed_count_inflight[workflow_id] = future
+        future.add_done_callback(lambda _: _failed_count_inflight.pop(workflow_id, None))
+    # Shield so one cancelled caller does not cancel the lookup for the others
+    count = await asyncio.shield(future)
     return count, query
 
 @mcp.tool()
@@ -58,4 +92,44 @@ async def get_failed_runs_count_only(workflow_id: str) -> int:
         count, _query = await _failed_runs_count_and_query(workflow_id)
         return count
     except Exception:
-        return 0
\ No newline at end of file
+        return 0
+
+
+@mcp.tool()
+async def get_failed_runs_batch(
+    workflow_ids: List[str],
+    concurrency: int = 16
+) -> Dict[str, Any]:
+    """
+    Get failed run counts for several workflow IDs at once.
+
+    Lookups run concurrently (at most `concurrency` CLI calls in flight) and
+    duplicate IDs are looked up once. A workflow whose count cannot be
+    retrieved is reported as 0, like get_failed_runs_count_only.
+
+    Args:
+        workflow_ids: The workflow IDs to check for failed runs
+        concurrency: Maximum number of concurrent count queries (default: 16)
+
+    Returns:
+        Dictionary with keys: success, failed_counts (workflow ID -> count)
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _count(workflow_id: str) -> Tuple[str, int]:
+        async with semaphore:
+            return workflow_id, await get_failed_runs_count_only(workflow_id)
+
+    results = await asyncio.gather(*(_count(wid) for wid in dict.fromkeys(workflow_ids)))
+
+    return {
+        "success": True,
+        "failed_counts": dict(results)
+    }
+
+
+__all__ = [
+    "get_failed_runs",
+    "get_failed_runs_batch",
+    "get_failed_runs_count_only",
+]
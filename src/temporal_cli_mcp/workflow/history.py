@@ -1,8 +1,17 @@
-import base64
-import json
-from typing import Any, Dict, Optional
+from binascii import a2b_base64
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
 
+from pydantic import ValidationError as PydanticValidationError
+
+from ..base import AsyncCommandExecutor
+from ..command_builder import TemporalCommandBuilder
+from ..config import config
 from ..core import mcp
+from ..exceptions import ValidationError
+from ..json_codec import JSONDecodeError, dumps, loads
+from ..models import WorkflowHistoryRequest
 
 # Maximum length for decoded strings to prevent memory issues
 MAX_DECODED_STRING_LENGTH = 4000
@@ -21,6 +30,66 @@ def _truncate_string_if_needed(text: str) -> str:
 # Filtering Helper Functions
 # ============================================================================
 
+# Attribute fields kept by the "standard" projection
+_FAILURE_DETAIL_FIELDS = ("failure", "timeoutType", "reason", "cause")
+_IDENTIFIER_FIELDS = (
+    "activityId", "activityType",  # Activity identifiers
+    "timerId",  # Timer identifiers
+    "workflowId", "workflowType",  # Child workflow identifiers
+    "signalName",  # Signal identifiers
+)
+_FAILURE_PROJECTION_FIELDS = _FAILURE_DETAIL_FIELDS + _IDENTIFIER_FIELDS
+
+# Projection levels whose output can contain payloads
+_PAYLOAD_FIELD_LEVELS = frozenset({"full", "standard"})
+
+# Event types the "last_failure_context" preset anchors on
+_FAILURE_EVENT_TYPES = frozenset({
+    "WORKFLOW_TASK_FAILED",
+    "ACTIVITY_TASK_FAILED",
+    "CHILD_WORKFLOW_EXECUTION_FAILED",
+    "WORKFLOW_EXECUTION_FAILED",
+})
+
+# Event types the "resets" preset keeps
+_RESET_EVENT_TYPES = frozenset({"WORKFLOW_TASK_FAILED"})
+
+# Event type substrings that make the "standard" projection keep failure details
+_FAILURE_MARKERS = ("Failed", "TimedOut", "Terminated")
+
+
+@lru_cache(maxsize=128)
+def _has_failure_marker(event_type: str) -> bool:
+    """Whether an event type names a failure, timeout or termination.
+    
+    A history only uses a few dozen distinct event types, so this is cached.
+    """
+    return any(marker in event_type for marker in _FAILURE_MARKERS)
+
+
+@lru_cache(maxsize=256)
+def _attributes_key_for_type(event_type: str) -> str:
+    """Name of the attributes key for an event type, e.g. ACTIVITY_TASK_SCHEDULED
+    (or EVENT_TYPE_ACTIVITY_TASK_SCHEDULED) -> activityTaskScheduledEventAttributes.
+    """
+    first, *rest = event_type.removeprefix("EVENT_TYPE_").lower().split("_")
+    return first + "".join(word.capitalize() for word in rest) + "EventAttributes"
+
+
+def _attributes_key(event: dict) -> Optional[str]:
+    """Return the event's *EventAttributes key, or None if it has none.
+    
+    A Temporal event carries exactly one attributes key, named after its event
+    type; the keys are only scanned when that name is not present.
+    """
+    event_type = event.get("eventType")
+    if isinstance(event_type, str):
+        key = _attributes_key_for_type(event_type)
+        if key in event:
+            return key
+    
+    return next((k for k in event if k.endswith("EventAttributes")), None)
+
 
 def _apply_field_projection(events: list, level: str) -> list:
     """Apply field projection to reduce event size.
@@ -35,13 +104,24 @@ def _apply_field_projection(events: list, level: str) -> list:
     if level == "full":
         return events
     
+    # Minimal (and any unrecognised level): eventId, eventType, eventTime only
+    if level != "standard":
+        return [
+            {
+                "eventId": event.get("eventId"),
+                "eventType": event.get("eventType"),
+                "eventTime": event.get("eventTime"),
+            }
+            if isinstance(event, dict) else event
+            for event in events
+        ]
+    
     projected_events = []
     for event in events:
         if not isinstance(event, dict):
             projected_events.append(event)
             continue
         
-        # Minimal: eventId, eventType, eventTime only
         projected = {
             "eventId": event.get("eventId"),
             "eventType": event.get("eventType"),
@@ -49,52 +129,83 @@ def _apply_field_projection(events: list, level: str) -> list:
         }
         
         # Standard: add failure messages and key identifiers
-        if level == "standard":
-            event_type = event.get("eventType", "")
-            
-            # Add failure-related fields
-            if "Failed" in event_type or "TimedOut" in event_type or "Terminated" in event_type:
-                for key in event.keys():
-                    if "EventAttributes" in key:
-                        attrs = event[key]
-                        if isinstance(attrs, dict):
-                            # Include failure/timeout/termination details
-                            if "failure" in attrs:
-                                projected.setdefault(key, {})["failure"] = attrs["failure"]
-                            if "timeoutType" in attrs:
-                                projected.setdefault(key, {})["timeoutType"] = attrs["timeoutType"]
-                            if "reason" in attrs:
-                                projected.setdefault(key, {})["reason"] = attrs["reason"]
-                            if "cause" in attrs:
-                                projected.setdefault(key, {})["cause"] = attrs["cause"]
-            
-            # Add key identifiers for correlation
-            for key in event.keys():
-                if "EventAttributes" in key:
-                    attrs = event[key]
-                    if isinstance(attrs, dict):
-                        # Activity identifiers
-                        if "activityId" in attrs:
-                            projected.setdefault(key, {})["activityId"] = attrs["activityId"]
-                        if "activityType" in attrs:
-                            projected.setdefault(key, {})["activityType"] = attrs["activityType"]
-                        # Timer identifiers
-                        if "timerId" in attrs:
-                            projected.setdefault(key, {})["timerId"] = attrs["timerId"]
-                        # Child workflow identifiers
-                        if "workflowId" in attrs:
-                            projected.setdefault(key, {})["workflowId"] = attrs["workflowId"]
-                        if "workflowType" in attrs:
-                            projected.setdefault(key, {})["workflowType"] = attrs["workflowType"]
-                        # Signal identifiers
-                        if "signalName" in attrs:
-                            projected.setdefault(key, {})["signalName"] = attrs["signalName"]
+        event_type = event.get("eventType", "")
+        
+        # Failure/timeout/termination details only for failure-related events
+        if _has_failure_marker(event_type):
+            attr_fields = _FAILURE_PROJECTION_FIELDS
+        else:
+            attr_fields = _IDENTIFIER_FIELDS
+        
+        key = _attributes_key(event)
+        if key is not None:
+            attrs = event[key]
+            if isinstance(attrs, dict):
+                selected = {field: attrs[field] for field in attr_fields if field in attrs}
+                if selected:
+                    projected[key] = selected
         
         projected_events.append(projected)
     
     return projected_events
 
 
+def _preset_recent(events: list) -> tuple[list, dict]:
+    """Most common use case: recent events with minimal fields."""
+    # Auto-applies: reverse=True, limit=30, fields="standard"
+    additional_settings = {
+        "reverse": True,
+        "limit": 30,
+        "fields": "standard"
+    }
+    # Return all events - reverse/limit/fields will be applied later
+    return events, additional_settings
+
+
+def _preset_last_failure_context(events: list) -> tuple[list, dict]:
+    """Last failure event plus the 10 events before it."""
+    # Find last failure event
+    last_failure_idx = None
+    for i in range(len(events) - 1, -1, -1):
+        event = events[i]
+        if type(event) is dict and event.get("eventType") in _FAILURE_EVENT_TYPES:
+            last_failure_idx = i
+            break
+    
+    if last_failure_idx is not None:
+        # Return last failure + 10 events before it
+        start_idx = max(0, last_failure_idx - 10)
+        return events[start_idx:last_failure_idx + 1], {}
+    else:
+        # No failures found, return empty
+        return [], {}
+
+
+def _preset_resets(events: list) -> tuple[list, dict]:
+    """All WORKFLOW_TASK_FAILED events (typically include resets)."""
+    filtered = [e for e in events if type(e) is dict and e.get("eventType") in _RESET_EVENT_TYPES]
+    return filtered, {}
+
+
+def _is_reset_event(event: Any) -> bool:
+    """Whether an event is kept by the "resets" preset."""
+    return type(event) is dict and event.get("eventType") in _RESET_EVENT_TYPES
+
+
+# Presets whose selection is a per-event type test, applied while the history
+# is parsed; the preset itself still runs afterwards on the kept events
+_PRESET_STREAM_FILTERS: Dict[str, Callable[[Any], bool]] = {
+    "resets": _is_reset_event,
+}
+
+# Preset name -> handler returning (filtered_events, additional_settings)
+_PRESETS = {
+    "recent": _preset_recent,
+    "last_failure_context": _preset_last_failure_context,
+    "resets": _preset_resets,
+}
+
+
 def _apply_preset(events: list, preset: str) -> tuple[list, list[str], dict]:
     """Apply a smart preset filter to events.
     
@@ -106,50 +217,68 @@ def _apply_preset(events: list, preset: str) -> tuple[list, list[str], dict]:
         Tuple of (filtered_events, list of filter descriptions applied, additional_settings)
         where additional_settings contains preset-specific parameter overrides
     """
-    filters_applied = [f"preset={preset}"]
-    additional_settings = {}
-    
-    if preset == "recent":
-        # Most common use case: recent events with minimal fields
-        # Auto-applies: reverse=True, limit=30, fields="standard"
-        additional_settings = {
-            "reverse": True,
-            "limit": 30,
-            "fields": "standard"
-        }
-        # Return all events - reverse/limit/fields will be applied later
-        return events, filters_applied, additional_settings
-    
-    elif preset == "last_failure_context":
-        # Find last failure event
-        failure_types = [
-            "WORKFLOW_TASK_FAILED",
-            "ACTIVITY_TASK_FAILED",
-            "CHILD_WORKFLOW_EXECUTION_FAILED",
-            "WORKFLOW_EXECUTION_FAILED",
-        ]
-        last_failure_idx = None
-        for i in range(len(events) - 1, -1, -1):
-            if isinstance(events[i], dict) and events[i].get("eventType") in failure_types:
-                last_failure_idx = i
-                break
-        
-        if last_failure_idx is not None:
-            # Return last failure + 10 events before it
-            start_idx = max(0, last_failure_idx - 10)
-            return events[start_idx:last_failure_idx + 1], filters_applied, additional_settings
-        else:
-            # No failures found, return empty
-            return [], filters_applied, additional_settings
-    
-    elif preset == "resets":
-        # All WORKFLOW_TASK_FAILED events (typically include resets)
-        filtered = [e for e in events if isinstance(e, dict) and e.get("eventType") == "WORKFLOW_TASK_FAILED"]
-        return filtered, filters_applied, additional_settings
-    
-    else:
+    handler = _PRESETS.get(preset)
+    if handler is None:
         # Unknown preset, return all events
-        return events, [f"preset={preset} (unknown, no filtering applied)"], additional_settings
+        return events, [f"preset={preset} (unknown, no filtering applied)"], {}
+    
+    filtered, additional_settings = handler(events)
+    return filtered, [f"preset={preset}"], additional_settings
+
+
+# Events that end a workflow run; once present, the run's history is final
+_CLOSE_EVENT_TYPES = frozenset({
+    "WORKFLOW_EXECUTION_COMPLETED",
+    "WORKFLOW_EXECUTION_FAILED",
+    "WORKFLOW_EXECUTION_TIMED_OUT",
+    "WORKFLOW_EXECUTION_CANCELED",
+    "WORKFLOW_EXECUTION_TERMINATED",
+    "WORKFLOW_EXECUTION_CONTINUED_AS_NEW",
+})
+
+# Responses for explicitly requested, closed runs. They are kept as JSON text,
+# so the LRU is bounded by total size and every hit parses a private copy.
+_CLOSED_HISTORY_CACHE_SIZE = 32
+_CLOSED_HISTORY_CACHE_MAX_CHARS = 8 * 1024 * 1024
+_closed_history_cache: "OrderedDict[tuple, str]" = OrderedDict()
+
+
+def _ends_with_close_event(events: list) -> bool:
+    """Whether the last event of a history closes the workflow run."""
+    if not events or type(events[-1]) is not dict:
+        return False
+    event_type = events[-1].get("eventType")
+    return (
+        isinstance(event_type, str)
+        and event_type.removeprefix("EVENT_TYPE_") in _CLOSE_EVENT_TYPES
+    )
+
+
+def _cache_closed_history(cache_key: tuple, response: Dict[str, Any]) -> None:
+    """Cache a closed run's response, evicting least recently used ones over budget."""
+    text = dumps(response)
+    if len(text) > _CLOSED_HISTORY_CACHE_MAX_CHARS:
+        return
+    _closed_history_cache[cache_key] = text
+    _closed_history_cache.move_to_end(cache_key)
+    total = sum(map(len, _closed_history_cache.values()))
+    while (
+        len(_closed_history_cache) > _CLOSED_HISTORY_CACHE_SIZE
+        or total > _CLOSED_HISTORY_CACHE_MAX_CHARS
+    ):
+        _key, evicted = _closed_history_cache.popitem(last=False)
+        total -= len(evicted)
+
+
+@lru_cache(maxsize=8)
+def _get_history_exec_builder(
+    env: Optional[str], executor_timeout: float, command_timeout: float
+) -> Tuple[AsyncCommandExecutor, TemporalCommandBuilder]:
+    """Return a shared (executor, builder) pair for history commands."""
+    return (
+        AsyncCommandExecutor(executor_timeout),
+        TemporalCommandBuilder(env=env, timeout_seconds=command_timeout),
+    )
 
 
 @mcp.tool()
@@ -222,56 +351,50 @@ async def get_workflow_history(
         # Custom limit
         get_workflow_history(workflow_id="megaflow-xyz", preset="recent", limit=50)
     """
-    import json
-    import base64
-    from ..models import WorkflowHistoryRequest
-    from ..base import AsyncCommandExecutor
-    from ..command_builder import TemporalCommandBuilder
-    from ..config import config
-    from ..exceptions import ValidationError
-    
-    def _sanitize_for_fastmcp(obj):
-        """Remove bytes objects that cause FastMCP to fail during iteration."""
-        if isinstance(obj, dict):
-            return {k: _sanitize_for_fastmcp(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [_sanitize_for_fastmcp(v) for v in obj]
-        elif isinstance(obj, (bytes, bytearray)):
-            return base64.b64encode(obj).decode('utf-8')
-        else:
-            return obj
-    
     try:
-        # Validate input
-        request = WorkflowHistoryRequest(
-            workflow_id=workflow_id,
-            run_id=run_id,
-            decode_payloads=decode_payloads
-        )
+        # Validate input (FastMCP has already type-checked the arguments)
+        request = WorkflowHistoryRequest.fast_build(workflow_id, run_id, decode_payloads)
         
-        # Create executor and builder
-        executor = AsyncCommandExecutor()
+        # Get executor and builder (shared across calls with the same settings)
         # Use provided timeout or fallback to config default
         timeout = timeout_seconds if timeout_seconds is not None else config.timeout
-        builder = TemporalCommandBuilder(env=config.env, timeout_seconds=timeout)
+        executor, builder = _get_history_exec_builder(config.env, config.timeout, timeout)
+        
+        # A closed run's history never changes, so its responses are reused
+        cache_key = None
+        if request.run_id:
+            cache_key = (
+                config.env, timeout, request.workflow_id, request.run_id,
+                request.decode_payloads, limit, reverse, fields, preset,
+            )
+            cached = _closed_history_cache.get(cache_key)
+            if cached is not None:
+                _closed_history_cache.move_to_end(cache_key)
+                return loads(cached)
         
         # Build and execute command
         workflow_args = builder.build_workflow_history(request.workflow_id, request.run_id)
         cmd = builder.build_full_command(workflow_args)
-        result = await executor.execute(cmd)
+        # Histories can be huge; stream-parse the events instead of buffering stdout.
+        # Presets that keep events by type alone drop the others during the parse.
+        keep = _PRESET_STREAM_FILTERS.get(preset)
+        result = await executor.execute_stream(cmd, "events", keep)
         
         if not result["success"]:
             raise Exception(f"Failed to get workflow history: {result['stderr']}")
         
         # Track original event count for filter_info
-        original_event_count = len(result.get("data", {}).get("events", []))
-
-        # Step 1: Decode payloads if requested
         events = result.get("data", {}).get("events", [])
-        if request.decode_payloads and events:
-            events = _decode_event_payloads(events)
+        original_event_count = result.pop("item_count", len(events))
         
-        # Step 2: Apply filtering if any filter params are provided
+        # Only an unfiltered parse shows whether the history ends with a close event
+        history_closed = (
+            cache_key is not None and keep is None and _ends_with_close_event(events)
+        )
+        
+        # Step 1: Select events if any filter params are provided. Selection
+        # only looks at event types and positions, so it runs before decoding
+        # and payloads are decoded just for the events that are returned.
         filters_applied = []
         
         # Track effective values (may be overridden by preset)
@@ -280,14 +403,14 @@ async def get_workflow_history(
         effective_fields = fields
         
         # Check if any filtering is needed
-        needs_filtering = (
+        needs_filtering = original_event_count > 0 and (
             preset is not None
             or limit is not None
             or reverse
             or fields != "full"
         )
         
-        if needs_filtering and events:
+        if needs_filtering:
             # Apply preset first (may override reverse/limit/fields)
             if preset:
                 events, preset_filters, additional_settings = _apply_preset(events, preset)
@@ -301,22 +424,31 @@ async def get_workflow_history(
                 if "fields" in additional_settings and fields == "full":
                     effective_fields = additional_settings["fields"]
             
-            # Apply reverse and limit
-            if effective_reverse:
-                events = list(reversed(events))
+            # Apply reverse and limit in a single slice; events[:-n-1:-1] is the
+            # first n events of the reversed list without building all of it
+            if effective_reverse and effective_limit is not None:
+                events = events[:-effective_limit - 1:-1]
+                filters_applied.extend(("reverse=True", f"limit={effective_limit}"))
+            elif effective_reverse:
+                events = events[::-1]
                 filters_applied.append("reverse=True")
-            
-            if effective_limit is not None:
+            elif effective_limit is not None:
                 events = events[:effective_limit]
                 filters_applied.append(f"limit={effective_limit}")
-            
-            # Apply field projection last
-            if effective_fields != "full":
-                events = _apply_field_projection(events, effective_fields)
-                filters_applied.append(f"fields={effective_fields}")
         
-        # Build result with filter info
-        new_result = dict(result)
+        # Step 2: Decode payloads if requested and kept; only the "full" and
+        # "standard" projections keep event attributes that can hold payloads
+        if request.decode_payloads and events and effective_fields in _PAYLOAD_FIELD_LEVELS:
+            events = _decode_event_payloads(events)
+        
+        # Step 3: Apply field projection last
+        if needs_filtering and effective_fields != "full":
+            events = _apply_field_projection(events, effective_fields)
+            filters_applied.append(f"fields={effective_fields}")
+        
+        # Build result with filter info; the executor result belongs to this
+        # call, so it is updated in place rather than copied
+        new_result = result
         if "data" in new_result:
             new_result["data"]["events"] = events
 
@@ -330,13 +462,15 @@ async def get_workflow_history(
                 "filters_applied": filters_applied,
             }
         
-        # WORKAROUND: Sanitize the result to avoid FastMCP's dictionary iteration bug
-        return _sanitize_for_fastmcp(new_result)
+        if history_closed:
+            _cache_closed_history(cache_key, new_result)
+        
+        # No bytes can reach the result (FastMCP fails on them): the CLI JSON holds
+        # none and payload decoding only stores JSON values and str
+        return new_result
         
-    except Exception as e:
-        if "ValidationError" in str(type(e)):
-            raise ValidationError(f"Invalid input: {e}")
-        raise
+    except PydanticValidationError as e:
+        raise ValidationError(f"Invalid input: {e}") from e
 
 
 def _decode_event_payloads(events: list) -> list:
@@ -355,106 +489,143 @@ def _decode_event_payloads(events: list) -> list:
     return decoded_events
 
 
+# Common payload locations in workflow events
+_PAYLOAD_PATHS = (
+    # Workflow execution started
+    ("workflowExecutionStartedEventAttributes", "input", "payloads"),
+    ("workflowExecutionStartedEventAttributes", "memo", "fields"),
+    # Child workflow execution
+    ("startChildWorkflowExecutionInitiatedEventAttributes", "input", "payloads"),
+    ("childWorkflowExecutionCompletedEventAttributes", "result", "payloads"),
+    # Activity task
+    ("activityTaskScheduledEventAttributes", "input", "payloads"),
+    ("activityTaskCompletedEventAttributes", "result", "payloads"),
+    # Signal workflow
+    ("signalExternalWorkflowExecutionInitiatedEventAttributes", "input", "payloads"),
+    # Query workflow
+    ("workflowExecutionSignaledEventAttributes", "input", "payloads"),
+    # Workflow execution completed
+    ("workflowExecutionCompletedEventAttributes", "result", "payloads"),
+    # Workflow execution failed
+    ("workflowExecutionFailedEventAttributes", "failure", "cause", "encodedAttributes"),
+)
+
+# Payload paths grouped by their top-level attributes key; an event carries a
+# single *EventAttributes key, so one dict lookup per key selects its paths
+_PAYLOAD_PATHS_BY_ATTR: Dict[str, Tuple[Tuple[str, ...], ...]] = {
+    attr: tuple(path for path in _PAYLOAD_PATHS if path[0] == attr)
+    for attr in dict.fromkeys(path[0] for path in _PAYLOAD_PATHS)
+}
+
+
 def _decode_single_event_payloads(event: dict) -> dict:
     """Decode base64 payloads in a single workflow event."""
-    import copy
-    # Create a deep copy to avoid modifying the original and any shared nested structures
-    decoded_event = copy.deepcopy(event)
-    
-    # Common payload locations in workflow events
-    payload_paths = [
-        # Workflow execution started
-        ["workflowExecutionStartedEventAttributes", "input", "payloads"],
-        ["workflowExecutionStartedEventAttributes", "memo", "fields"],
-        # Child workflow execution
-        ["startChildWorkflowExecutionInitiatedEventAttributes", "input", "payloads"],
-        ["childWorkflowExecutionCompletedEventAttributes", "result", "payloads"],
-        # Activity task
-        ["activityTaskScheduledEventAttributes", "input", "payloads"],
-        ["activityTaskCompletedEventAttributes", "result", "payloads"],
-        # Signal workflow
-        ["signalExternalWorkflowExecutionInitiatedEventAttributes", "input", "payloads"],
-        # Query workflow  
-        ["workflowExecutionSignaledEventAttributes", "input", "payloads"],
-        # Workflow execution completed
-        ["workflowExecutionCompletedEventAttributes", "result", "payloads"],
-        # Workflow execution failed
-        ["workflowExecutionFailedEventAttributes", "failure", "cause", "encodedAttributes"],
-    ]
-    
-    # Process each potential payload location
-    for path in payload_paths:
-        _decode_payloads_at_path(decoded_event, path)
+    # Shallow copy only; dicts on the way to a payload list are copied as they
+    # are changed, so the original event and its untouched subtrees are shared
+    decoded_event = dict(event)
+    
+    # Only the paths under the event's own attributes key need a walk
+    paths = _PAYLOAD_PATHS_BY_ATTR.get(_attributes_key(event))
+    if paths:
+        for path in paths:
+            _decode_payloads_at_path(decoded_event, path)
     
     return decoded_event
 
 
-def _decode_payloads_at_path(event: dict, path: list) -> None:
-    """Decode payloads at a specific path in the event structure."""
+def _decode_payloads_at_path(event: dict, path: Tuple[str, ...]) -> None:
+    """Decode payloads at a specific path in the event structure.
+    
+    ``event`` itself is updated in place; nested dicts along the path and the
+    payloads are copied before being changed (copy-on-write).
+    """
     current = event
+    parents = []
     
     # Navigate to the target location
     for key in path[:-1]:
         if isinstance(current, dict) and key in current:
+            parents.append(current)
             current = current[key]
         else:
             return  # Path doesn't exist
     
     # Check if final key exists and contains payloads
     final_key = path[-1]
-    if isinstance(current, dict) and final_key in current:
-        payloads = current[final_key]
-        if isinstance(payloads, list):
-            # Decode each payload in the list
-            for payload in payloads:
-                if isinstance(payload, dict):
-                    _decode_single_payload(payload)
+    if not (isinstance(current, dict) and final_key in current):
+        return
+    payloads = current[final_key]
+    if not isinstance(payloads, list):
+        return
+    
+    # Decode copies of the payloads in the list
+    decoded_payloads = []
+    for payload in payloads:
+        if isinstance(payload, dict):
+            payload = dict(payload)
+            _decode_single_payload(payload)
+        decoded_payloads.append(payload)
+    
+    # Copy each dict on the path back up to the event, which is already a copy
+    node = dict(current)
+    node[final_key] = decoded_payloads
+    for parent, key in zip(reversed(parents), reversed(path[:-1])):
+        if parent is not event:
+            parent = dict(parent)
+        parent[key] = node
+        node = parent
 
 
 def _decode_single_payload(payload: dict) -> None:
-    """Decode a single payload object with data and metadata fields."""
+    """Decode a single payload object with data and metadata fields.
+    
+    Decoded values are parsed JSON or str; raw bytes are never stored.
+    """
     # Decode data field
-    if "data" in payload and isinstance(payload["data"], str):
-        try:
-            # Decode base64
-            decoded_bytes = base64.b64decode(payload["data"])
-            # Try to parse as JSON
+    data = payload.get("data")
+    if isinstance(data, str):
+        payload["data"] = _decode_base64_value(data)
+    
+    # Decode metadata field (non-string values are kept as-is)
+    metadata = payload.get("metadata")
+    if isinstance(metadata, dict):
+        payload["metadata"] = {
+            key: _decode_metadata_value(value) if isinstance(value, str) else value
+            for key, value in metadata.items()
+        }
+
+
+# Bytes a JSON document can start with: value starts, whitespace, and what
+# the stdlib parser also accepts (NaN/Infinity, UTF-8 BOM, UTF-16/32 lead bytes)
+_JSON_FIRST_BYTES = frozenset(b'{["-0123456789tfnNI \t\r\n\xef\xfe\xff\x00')
+
+
+def _decode_base64_value(value: str) -> Any:
+    """Decode one base64 value: parsed JSON, else text, else a binary placeholder.
+    
+    Returns the original value if decoding fails.
+    """
+    try:
+        decoded_bytes = a2b_base64(value)
+        
+        # Try to parse as JSON, unless the first byte rules it out (plain text
+        # payloads then skip a parse attempt that would raise)
+        if not decoded_bytes or decoded_bytes[0] in _JSON_FIRST_BYTES:
             try:
-                decoded_json = json.loads(decoded_bytes.decode('utf-8'))
-                payload["data"] = decoded_json
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                # If not JSON, store as string
-                try:
-                    payload["data"] = _truncate_string_if_needed(decoded_bytes.decode('utf-8'))
-                except UnicodeDecodeError:
-                    payload["data"] = f"<binary data: {len(decoded_bytes)} bytes>"
-        except Exception:
-            # If decoding fails, silently continue
-            pass
-    
-    # Decode metadata field
-    if "metadata" in payload and isinstance(payload["metadata"], dict):
-        # Store decoded values temporarily to avoid modifying dict during iteration
-        decoded_metadata = {}
-        for key, value in payload["metadata"].items():
-            if isinstance(value, str):
-                try:
-                    # Decode base64
-                    decoded_bytes = base64.b64decode(value)
-                    try:
-                        decoded_json = json.loads(decoded_bytes.decode('utf-8'))
-                        decoded_metadata[key] = decoded_json
-                    except (json.JSONDecodeError, UnicodeDecodeError):
-                        try:
-                            decoded_metadata[key] = _truncate_string_if_needed(decoded_bytes.decode('utf-8'))
-                        except UnicodeDecodeError:
-                            decoded_metadata[key] = f"<binary data: {len(decoded_bytes)} bytes>"
-                except Exception:
-                    # If decoding fails, keep original value
-                    decoded_metadata[key] = value
-            else:
-                # Keep non-string values as-is
-                decoded_metadata[key] = value
+                return loads(decoded_bytes)
+            except (JSONDecodeError, UnicodeDecodeError):
+                pass
         
-        # Update the metadata dictionary after iteration is complete
-        payload["metadata"] = decoded_metadata
+        # If not JSON, store as string
+        try:
+            return _truncate_string_if_needed(decoded_bytes.decode('utf-8'))
+        except UnicodeDecodeError:
+            return f"<binary data: {len(decoded_bytes)} bytes>"
+    except Exception:
+        return value
+
+
+# Metadata values (encoding, message type) repeat on nearly every payload of a
+# history, so their decoding is cached; the decoded values are shared and must
+# not be mutated.
+_decode_metadata_value = lru_cache(maxsize=256)(_decode_base64_value)
@@ -1,5 +1,8 @@
+from datetime import date, datetime
 from typing import Any, Dict, Optional
 
+from pydantic import ValidationError as PydanticValidationError
+
 from ..core import mcp, run_temporal_command
 
 
@@ -24,8 +27,8 @@ async def list_workflows(
     from ..exceptions import ValidationError
     
     try:
-        # Validate input
-        request = WorkflowListRequest(query=query, limit=limit)
+        # Validate input (FastMCP has already type-checked the arguments)
+        request = WorkflowListRequest.fast_build(query, limit)
         
         # Pre-validate query syntax if provided
         if request.query:
@@ -92,10 +95,9 @@ async def list_workflows(
         
         return result
         
-    except Exception as e:
-        if "ValidationError" in str(type(e)):
-            raise ValidationError(f"Invalid input: {e}")
-        raise
+    except (PydanticValidationError, ValidationError) as e:
+        # Query errors raised above get the same "Invalid input" prefix as model errors
+        raise ValidationError(f"Invalid input: {e}") from e
 
 
 @mcp.tool()
@@ -149,9 +151,9 @@ async def list_workflows_structured(
                     end_time = time_filter.end_time
                     
                     # Convert datetime to string if needed
-                    if hasattr(start_time, 'isoformat'):
+                    if isinstance(start_time, (datetime, date)):
                         start_time = start_time.isoformat()
-                    if hasattr(end_time, 'isoformat'):
+                    if isinstance(end_time, (datetime, date)):
                         end_time = end_time.isoformat()
                     
                     builder.custom_condition(
@@ -229,7 +231,6 @@ async def list_workflows_structured(
         
         return result
         
-    except Exception as e:
-        if "ValidationError" in str(type(e)):
-            raise ValidationError(f"Invalid input: {e}")
-        raise
+    except (PydanticValidationError, ValidationError) as e:
+        # Query errors raised above get the same "Invalid input" prefix as model errors
+        raise ValidationError(f"Invalid input: {e}") from e
@@ -11,6 +11,6 @@ async def query_workflow(
 ) -> Dict[str, Any]:
     args = ["workflow", "query", "--workflow-id", workflow_id, "--type", query_type]
     if input_data:
-        args.extend(["--input", input_data])
+        args.extend(("--input", input_data))
     result = await run_temporal_command(args, output="json")
     return result
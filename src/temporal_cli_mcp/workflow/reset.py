@@ -72,30 +72,30 @@ async def reset_workflow(
     
     # Add workflow-specific parameters for single workflow reset
     if workflow_id:
-        args.extend(["--workflow-id", workflow_id])
+        args.extend(("--workflow-id", workflow_id))
     
     if event_id:
-        args.extend(["--event-id", event_id])
+        args.extend(("--event-id", event_id))
         
     if run_id:
-        args.extend(["--run-id", run_id])
+        args.extend(("--run-id", run_id))
     
     # Add batch operation parameters
     if query:
-        args.extend(["--query", query])
+        args.extend(("--query", query))
         
     if reset_type:
-        args.extend(["--type", reset_type])
+        args.extend(("--type", reset_type))
         
     if build_id:
-        args.extend(["--build-id", build_id])
+        args.extend(("--build-id", build_id))
     
     # Add common parameters
     if reason:
-        args.extend(["--reason", reason])
+        args.extend(("--reason", reason))
         
     if reapply_exclude:
-        args.extend(["--reapply-exclude", reapply_exclude])
+        args.extend(("--reapply-exclude", reapply_exclude))
         
     if yes:
         args.append("--yes")
@@ -11,6 +11,6 @@ async def signal_workflow(
 ) -> Dict[str, Any]:
     args = ["workflow", "signal", "--workflow-id", workflow_id, "--name", signal_name]
     if input_data:
-        args.extend(["--input", input_data])
+        args.extend(("--input", input_data))
     result = await run_temporal_command(args, output="json")
     return result
@@ -12,8 +12,8 @@ async def start_workflow(
 ) -> Dict[str, Any]:
     args = ["workflow", "start", "--type", workflow_type, "--task-queue", task_queue]
     if workflow_id:
-        args.extend(["--workflow-id", workflow_id])
+        args.extend(("--workflow-id", workflow_id))
     if input_data:
-        args.extend(["--input", input_data])
+        args.extend(("--input", input_data))
     result = await run_temporal_command(args, output="json")
     return result
@@ -10,6 +10,6 @@ async def terminate_workflow(
 ) -> Dict[str, Any]:
     args = ["workflow", "terminate", "--workflow-id", workflow_id]
     if reason:
-        args.extend(["--reason", reason])
+        args.extend(("--reason", reason))
     result = await run_temporal_command(args, output="json")
     return result
@@ -1,5 +1,7 @@
 from typing import Any, Dict, Optional
 
+from pydantic import ValidationError as PydanticValidationError
+
 from ..core import mcp
 
 
@@ -45,7 +47,5 @@ async def trace_workflow(
         
         return result
         
-    except Exception as e:
-        if "ValidationError" in str(type(e)):
-            raise ValidationError(f"Invalid input: {e}")
-        raise
\ No newline at end of file
+    except PydanticValidationError as e:
+        raise ValidationError(f"Invalid input: {e}") from e
\ No newline at end of file
@@ -0,0 +1,13 @@
+"""Pytest setup for temporal-cli-mcp tests."""
+
+import os
+import sys
+
+# Import the package from ./src; the repo-root temporal_cli_mcp.py is only a
+# `python -m` shim. Pytest puts the repo root on sys.path when it imports test
+# modules, so the package is imported here while ./src still comes first.
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import temporal_cli_mcp  # noqa: E402,F401
@@ -218,7 +218,9 @@ class TemporalMCPClientSimulator:
                         {"name": "describe_workflow", "description": "Describe workflow"},
                         {"name": "get_workflow_history", "description": "Get workflow history"},
                         {"name": "build_workflow_query", "description": "Build workflow query"},
-                        {"name": "validate_workflow_query", "description": "Validate workflow query"}
+                        {"name": "validate_workflow_query", "description": "Validate workflow query"},
+                        {"name": "validate_workflow_queries", "description": "Validate several workflow queries"},
+                        {"name": "get_failed_runs_batch", "description": "Get failed run counts for several workflows"}
                     ]
                 }
             }
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Unit tests for server command-line handling.
+Covers --env parsing and --help without starting the MCP server.
+"""
+
+import pytest
+
+from temporal_cli_mcp.core import _parse_env_arg, init_env_from_args
+
+
+class TestEnvArgParsing:
+    """Test the startup --env argument parser."""
+    
+    @pytest.mark.parametrize("argv, expected", [
+        (["--env", "prod"], "prod"),
+        (["--env=prod"], "prod"),
+        (["--env=a=b"], "a=b"),
+        ([], None),
+        (["--env"], None),
+        (["--env="], ""),
+        (["--env", "staging", "--env=prod"], "prod"),
+        (["--verbose", "--env", "prod", "extra"], "prod"),
+        (["--environment", "prod"], None),
+    ])
+    def test_parse_env_arg(self, argv, expected):
+        """Test --env VALUE / --env=VALUE forms, missing values and unknown arguments."""
+        assert _parse_env_arg(argv) == expected
+    
+    @pytest.mark.parametrize("flag", ["-h", "--help"])
+    def test_help_prints_usage_and_exits(self, flag, capsys):
+        """Test that -h/--help still print the argparse help."""
+        with pytest.raises(SystemExit) as exc_info:
+            init_env_from_args([flag])
+        
+        assert exc_info.value.code == 0
+        assert "--env" in capsys.readouterr().out
+    
+    def test_init_env_from_args_applies_env(self, monkeypatch):
+        """Test that a parsed --env is applied to the config and CLI prefix."""
+        from temporal_cli_mcp import core
+        from temporal_cli_mcp.config import config
+        
+        monkeypatch.setattr(config, "env", config.env)
+        monkeypatch.setattr(config, "setup_logging", lambda: None)
+        monkeypatch.setattr(core, "_TEMPORAL_GLOBAL_PREFIX", core._TEMPORAL_GLOBAL_PREFIX)
+        
+        init_env_from_args(["--env", "prod"])
+        
+        assert config.env == "prod"
+        assert core._TEMPORAL_GLOBAL_PREFIX == ["--env", "prod"]
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Unit tests for AsyncCommandExecutor.
+Run a small shell script in place of the temporal CLI, so no Temporal
+environment is needed.
+"""
+
+import os
+import time
+import asyncio
+import logging
+
+import pytest
+
+from temporal_cli_mcp.base import AsyncCommandExecutor
+from temporal_cli_mcp.exceptions import CommandExecutionError
+
+logger = logging.getLogger(__name__)
+
+
+def _write_cli(tmp_path, body: str) -> str:
+    """Write an executable fake CLI script and return its path."""
+    path = tmp_path / "temporal"
+    path.write_text("#!/bin/sh\n" + body)
+    path.chmod(0o755)
+    return str(path)
+
+
+def _process_exists(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+class TestAsyncCommandExecutor:
+    """Test process handling of AsyncCommandExecutor.execute."""
+    
+    @pytest.fixture
+    def hanging_cli(self, tmp_path):
+        """A CLI that records its PID and never exits on its own."""
+        pid_file = tmp_path / "pid"
+        cli = _write_cli(tmp_path, f"echo $$ > {pid_file}\nexec sleep 30\n")
+        return cli, pid_file
+    
+    def test_execute_parses_json(self, tmp_path):
+        """Test that JSON output is parsed into data."""
+        cli = _write_cli(tmp_path, "echo '{\"count\": 3}'\n")
+        
+        result = asyncio.run(AsyncCommandExecutor(timeout=10).execute([cli, "workflow", "count"]))
+        
+        assert result["success"] is True
+        assert result["data"] == {"count": 3}
+    
+    def test_execute_timeout_kills_process(self, hanging_cli):
+        """Test that a timed-out command is killed and reported as CommandExecutionError."""
+        cli, pid_file = hanging_cli
+        
+        with pytest.raises(CommandExecutionError, match="timed out"):
+            asyncio.run(AsyncCommandExecutor(timeout=0.5).execute([cli]))
+        
+        assert not _process_exists(int(pid_file.read_text())), "Timed-out CLI should be killed"
+    
+    def test_execute_cancel_kills_process(self, hanging_cli):
+        """Test that cancelling execute kills the child process."""
+        cli, pid_file = hanging_cli
+        
+        async def scenario():
+            task = asyncio.ensure_future(AsyncCommandExecutor(timeout=30).execute([cli]))
+            while not pid_file.exists() or not pid_file.read_text().strip():
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        
+        asyncio.run(scenario())
+        
+        assert not _process_exists(int(pid_file.read_text())), "Cancelled CLI should be killed"
+    
+    def test_execute_runs_commands_concurrently(self, tmp_path):
+        """Test that parallel commands are not serialized behind a worker pool."""
+        cli = _write_cli(tmp_path, "sleep 0.5\necho '{}'\n")
+        executor = AsyncCommandExecutor(timeout=10)
+        
+        async def scenario():
+            return await asyncio.gather(*(executor.execute([cli]) for _ in range(16)))
+        
+        started = time.monotonic()
+        results = asyncio.run(scenario())
+        elapsed = time.monotonic() - started
+        
+        assert all(result["success"] for result in results)
+        assert elapsed < 2.0, f"16 parallel 0.5s commands took {elapsed:.1f}s"
+        logger.info(f"✓ 16 parallel commands finished in {elapsed:.2f}s")
+
+
+class TestExecuteStream:
+    """Test streamed parsing and process handling of AsyncCommandExecutor.execute_stream."""
+    
+    @pytest.fixture(autouse=True)
+    def require_ijson(self):
+        pytest.importorskip("ijson")
+    
+    @pytest.fixture
+    def history_cli(self, tmp_path):
+        """A CLI that prints a history document with five events."""
+        events = ", ".join(
+            f'{{"eventId": "{i}", "eventType": "{"WORKFLOW_TASK_FAILED" if i % 2 else "TIMER_FIRED"}", "size": 1.5}}'
+            for i in range(1, 6)
+        )
+        return _write_cli(tmp_path, f"cat <<'EOF'\n{{\"events\": [{events}]}}\nEOF\n")
+    
+    def test_stream_parses_items(self, history_cli):
+        """Test that the items of the top-level array are parsed, floats as float."""
+        result = asyncio.run(AsyncCommandExecutor(timeout=10).execute_stream([history_cli]))
+        
+        assert result["success"] is True
+        events = result["data"]["events"]
+        assert [event["eventId"] for event in events] == ["1", "2", "3", "4", "5"]
+        assert type(events[0]["size"]) is float
+        assert "item_count" not in result
+    
+    def test_stream_keep_filter(self, history_cli):
+        """Test that keep drops items during the parse and item_count counts all of them."""
+        keep = lambda event: event["eventType"] == "WORKFLOW_TASK_FAILED"
+        
+        result = asyncio.run(AsyncCommandExecutor(timeout=10).execute_stream([history_cli], "events", keep))
+        
+        assert [event["eventId"] for event in result["data"]["events"]] == ["1", "3", "5"]
+        assert result["item_count"] == 5
+    
+    def test_stream_invalid_json(self, tmp_path):
+        """Test that malformed output is reported as a JSON error, not raised."""
+        cli = _write_cli(tmp_path, "echo '{\"events\": [{\"eventId\": '\n")
+        
+        result = asyncio.run(AsyncCommandExecutor(timeout=10).execute_stream([cli]))
+        
+        assert result["success"] is True
+        assert result["data"] is None
+        assert "json_error" in result
+    
+    def test_stream_command_failure(self, tmp_path):
+        """Test that a failing command reports its return code and stderr."""
+        cli = _write_cli(tmp_path, "echo 'workflow not found' >&2\nexit 3\n")
+        
+        result = asyncio.run(AsyncCommandExecutor(timeout=10).execute_stream([cli]))
+        
+        assert result["success"] is False
+        assert result["returncode"] == 3
+        assert result["stderr"].strip() == "workflow not found"
+    
+    def test_stream_timeout_kills_process(self, tmp_path):
+        """Test that a stream that stalls mid-document is killed on timeout."""
+        pid_file = tmp_path / "pid"
+        cli = _write_cli(tmp_path, f"echo $$ > {pid_file}\necho '{{\"events\": ['\nexec sleep 30\n")
+        
+        with pytest.raises(CommandExecutionError, match="timed out"):
+            asyncio.run(AsyncCommandExecutor(timeout=0.5).execute_stream([cli]))
+        
+        assert not _process_exists(int(pid_file.read_text())), "Timed-out CLI should be killed"
+    
+    def test_stream_cancel_kills_process(self, tmp_path):
+        """Test that cancelling execute_stream kills the child process."""
+        pid_file = tmp_path / "pid"
+        cli = _write_cli(tmp_path, f"echo $$ > {pid_file}\nexec sleep 30\n")
+        
+        async def scenario():
+            task = asyncio.ensure_future(AsyncCommandExecutor(timeout=30).execute_stream([cli]))
+            while not pid_file.exists() or not pid_file.read_text().strip():
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        
+        asyncio.run(scenario())
+        
+        assert not _process_exists(int(pid_file.read_text())), "Cancelled CLI should be killed"
+    
+    def test_fallback_without_ijson(self, history_cli, monkeypatch):
+        """Test that without ijson the buffered parse gives the same result shape."""
+        from temporal_cli_mcp import base
+        
+        monkeypatch.setattr(base, "ijson", None)
+        keep = lambda event: event["eventType"] == "TIMER_FIRED"
+        
+        result = asyncio.run(AsyncCommandExecutor(timeout=10).execute_stream([history_cli], "events", keep))
+        
+        assert [event["eventId"] for event in result["data"]["events"]] == ["2", "4"]
+        assert result["item_count"] == 5
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Unit tests for get_workflow_history.
+Run the tool in-process against a stubbed executor, so no Temporal CLI or
+environment is needed.
+"""
+
+import copy
+import base64
+import asyncio
+from collections import OrderedDict
+
+import pytest
+
+from temporal_cli_mcp.command_builder import TemporalCommandBuilder
+from temporal_cli_mcp.workflow import history
+
+
+def _event(event_id: int, event_type: str, **attributes) -> dict:
+    event = {
+        "eventId": str(event_id),
+        "eventTime": f"2025-01-01T00:00:{event_id:02d}Z",
+        "eventType": event_type,
+    }
+    event.update(attributes)
+    return event
+
+
+def _closed_history() -> list:
+    return [
+        _event(1, "EVENT_TYPE_WORKFLOW_EXECUTION_STARTED"),
+        _event(2, "EVENT_TYPE_WORKFLOW_TASK_SCHEDULED"),
+        _event(3, "EVENT_TYPE_WORKFLOW_TASK_STARTED"),
+        _event(4, "EVENT_TYPE_WORKFLOW_TASK_COMPLETED"),
+        _event(5, "EVENT_TYPE_WORKFLOW_EXECUTION_COMPLETED"),
+    ]
+
+
+class _FakeExecutor:
+    """Stands in for AsyncCommandExecutor.execute_stream and counts calls."""
+    
+    def __init__(self, events: list):
+        self.events = events
+        self.calls = 0
+    
+    async def execute_stream(self, cmd, key="events", keep=None):
+        self.calls += 1
+        items = copy.deepcopy(self.events)
+        result = {"success": True, "returncode": 0, "stderr": "", "data": {key: items}}
+        if keep is not None:
+            result["item_count"] = len(items)
+            result["data"][key] = [item for item in items if keep(item)]
+        return result
+
+
+@pytest.fixture
+def fake_executor(monkeypatch):
+    """Route get_workflow_history through a fake executor with an empty cache."""
+    executor = _FakeExecutor(_closed_history())
+    monkeypatch.setattr(
+        history, "_get_history_exec_builder",
+        lambda env, executor_timeout, command_timeout: (executor, TemporalCommandBuilder(env=env)),
+    )
+    monkeypatch.setattr(history, "_closed_history_cache", OrderedDict())
+    return executor
+
+
+def _get_history(**kwargs) -> dict:
+    kwargs.setdefault("workflow_id", "wf-1")
+    return asyncio.run(history.get_workflow_history(**kwargs))
+
+
+class TestClosedHistoryCache:
+    """Test reuse of get_workflow_history responses for closed runs."""
+    
+    def test_hit_skips_cli(self, fake_executor):
+        """Test that a repeated request for a closed run is served from the cache."""
+        first = _get_history(run_id="run-1", limit=3)
+        second = _get_history(run_id="run-1", limit=3)
+        
+        assert fake_executor.calls == 1
+        assert second == first
+    
+    def test_hits_return_private_copies(self, fake_executor):
+        """Test that mutating a returned response does not change the cached one."""
+        first = _get_history(run_id="run-1")
+        expected = copy.deepcopy(first)
+        
+        first["data"]["events"].clear()
+        second = _get_history(run_id="run-1")
+        second["data"]["events"][0]["eventType"] = "CHANGED"
+        third = _get_history(run_id="run-1")
+        
+        assert fake_executor.calls == 1
+        assert second is not third
+        assert third == expected
+    
+    def test_different_arguments_miss(self, fake_executor):
+        """Test that the cache key covers ids and every filter argument."""
+        _get_history(run_id="run-1")
+        _get_history(run_id="run-1", limit=2)
+        _get_history(run_id="run-1", reverse=True)
+        _get_history(run_id="run-1", fields="minimal")
+        _get_history(run_id="run-1", preset="recent")
+        _get_history(run_id="run-1", decode_payloads=False)
+        _get_history(run_id="run-2")
+        _get_history(workflow_id="wf-2", run_id="run-1")
+        
+        assert fake_executor.calls == 8
+    
+    def test_only_closed_runs_with_run_id_are_cached(self, fake_executor):
+        """Test that runs without run_id, open runs and pre-filtered parses are not cached."""
+        _get_history()
+        _get_history()
+        assert fake_executor.calls == 2, "Latest run (no run_id) may still change"
+        
+        # The resets preset drops events during the parse, so closure is unknown
+        _get_history(run_id="run-1", preset="resets")
+        _get_history(run_id="run-1", preset="resets")
+        assert fake_executor.calls == 4
+        
+        fake_executor.events = _closed_history()[:-1]
+        _get_history(run_id="run-open")
+        _get_history(run_id="run-open")
+        assert fake_executor.calls == 6, "Open runs may still get new events"
+        assert not history._closed_history_cache
+    
+    def test_eviction_by_entry_count(self, fake_executor, monkeypatch):
+        """Test that the least recently used response is evicted beyond the entry limit."""
+        monkeypatch.setattr(history, "_CLOSED_HISTORY_CACHE_SIZE", 2)
+        
+        _get_history(run_id="run-1")
+        _get_history(run_id="run-2")
+        _get_history(run_id="run-1")  # hit; run-2 is now least recently used
+        _get_history(run_id="run-3")
+        assert fake_executor.calls == 3
+        
+        _get_history(run_id="run-1")
+        assert fake_executor.calls == 3
+        _get_history(run_id="run-2")
+        assert fake_executor.calls == 4
+    
+    def test_eviction_by_size(self, fake_executor, monkeypatch):
+        """Test that the cache stays within its size budget."""
+        response_size = len(history.dumps(_get_history(run_id="run-0")))
+        history._closed_history_cache.clear()
+        monkeypatch.setattr(history, "_CLOSED_HISTORY_CACHE_MAX_CHARS", response_size * 2 + 1)
+        
+        for run in ("run-1", "run-2", "run-3"):
+            _get_history(run_id=run)
+        
+        cached_runs = [key[3] for key in history._closed_history_cache]
+        assert cached_runs == ["run-2", "run-3"], "Oldest response should be evicted"
+        assert sum(map(len, history._closed_history_cache.values())) <= response_size * 2 + 1
+        
+        # A response larger than the whole budget is not cached at all
+        monkeypatch.setattr(history, "_CLOSED_HISTORY_CACHE_MAX_CHARS", response_size - 1)
+        history._closed_history_cache.clear()
+        _get_history(run_id="run-4")
+        assert not history._closed_history_cache
+
+
+def _b64(text: str) -> str:
+    return base64.b64encode(text.encode("utf-8")).decode("ascii")
+
+
+def _payload(data: str) -> dict:
+    return {"metadata": {"encoding": _b64("json/plain")}, "data": _b64(data)}
+
+
+def _activity_history() -> list:
+    """A 40-event closed history with payloads, one activity failure and two task failures."""
+    events = [_event(
+        1, "WORKFLOW_EXECUTION_STARTED",
+        workflowExecutionStartedEventAttributes={
+            "workflowType": {"name": "OrderFlow"},
+            "input": {"payloads": [_payload('{"order": 1}')]},
+        },
+    )]
+    for event_id in range(2, 40):
+        if event_id == 20:
+            events.append(_event(
+                event_id, "ACTIVITY_TASK_FAILED",
+                activityTaskFailedEventAttributes={
+                    "failure": {"message": "boom"},
+                    "scheduledEventId": "19",
+                    "identity": "worker-1",
+                },
+            ))
+        elif event_id in (25, 30):
+            events.append(_event(
+                event_id, "WORKFLOW_TASK_FAILED",
+                workflowTaskFailedEventAttributes={"cause": "RESET_WORKFLOW", "identity": "worker-1"},
+            ))
+        elif event_id % 2:
+            events.append(_event(
+                event_id, "ACTIVITY_TASK_SCHEDULED",
+                activityTaskScheduledEventAttributes={
+                    "activityId": str(event_id),
+                    "activityType": {"name": "Charge"},
+                    "input": {"payloads": [_payload("plain text")]},
+                    "taskQueue": {"name": "orders"},
+                },
+            ))
+        else:
+            events.append(_event(event_id, "WORKFLOW_TASK_SCHEDULED"))
+    events.append(_event(40, "WORKFLOW_EXECUTION_COMPLETED"))
+    return events
+
+
+def _event_ids(result: dict) -> list:
+    return [event["eventId"] for event in result["data"]["events"]]
+
+
+@pytest.fixture
+def activity_executor(fake_executor):
+    fake_executor.events = _activity_history()
+    return fake_executor
+
+
+class TestHistoryPipeline:
+    """Test event selection, projection and payload decoding of get_workflow_history."""
+    
+    def test_unfiltered_history_is_decoded(self, activity_executor):
+        """Test that without filters all events are returned, decoded, without filter_info."""
+        result = _get_history()
+        
+        assert _event_ids(result) == [str(i) for i in range(1, 41)]
+        assert "filter_info" not in result["data"]
+        payload = result["data"]["events"][0]["workflowExecutionStartedEventAttributes"]["input"]["payloads"][0]
+        assert payload == {"metadata": {"encoding": "json/plain"}, "data": {"order": 1}}
+    
+    def test_decode_payloads_disabled(self, activity_executor):
+        """Test that decode_payloads=False keeps the raw base64 values."""
+        result = _get_history(decode_payloads=False)
+        assert result["data"]["events"] == _activity_history()
+    
+    @pytest.mark.parametrize("kwargs, expected_ids, expected_filters", [
+        ({"limit": 3}, ["1", "2", "3"], ["limit=3"]),
+        ({"reverse": True, "limit": 3}, ["40", "39", "38"], ["reverse=True", "limit=3"]),
+        ({"reverse": True}, [str(i) for i in range(40, 0, -1)], ["reverse=True"]),
+        ({"reverse": True, "limit": 100}, [str(i) for i in range(40, 0, -1)], ["reverse=True", "limit=100"]),
+        ({"limit": 0}, [], ["limit=0"]),
+    ])
+    def test_reverse_and_limit(self, activity_executor, kwargs, expected_ids, expected_filters):
+        """Test reverse/limit selection and the filter_info it reports."""
+        result = _get_history(**kwargs)
+        
+        assert _event_ids(result) == expected_ids
+        filter_info = result["data"]["filter_info"]
+        assert filter_info["filters_applied"] == expected_filters
+        assert filter_info["original_event_count"] == 40
+        assert filter_info["filtered_event_count"] == len(expected_ids)
+    
+    def test_preset_recent(self, activity_executor):
+        """Test that the recent preset returns the last 30 events, newest first, standard fields."""
+        result = _get_history(preset="recent")
+        
+        assert _event_ids(result) == [str(i) for i in range(40, 10, -1)]
+        assert result["data"]["filter_info"]["filters_applied"] == [
+            "preset=recent", "reverse=True", "limit=30", "fields=standard",
+        ]
+        
+        events = {event["eventId"]: event for event in result["data"]["events"]}
+        # Identifiers are kept, payloads and other attributes are dropped
+        assert events["21"]["activityTaskScheduledEventAttributes"] == {
+            "activityId": "21", "activityType": {"name": "Charge"},
+        }
+        assert events["22"] == {
+            "eventId": "22", "eventType": "WORKFLOW_TASK_SCHEDULED", "eventTime": "2025-01-01T00:00:22Z",
+        }
+    
+    def test_preset_defaults_can_be_overridden(self, activity_executor):
+        """Test that explicit limit/fields override the preset defaults."""
+        result = _get_history(preset="recent", limit=3, fields="minimal")
+        
+        assert _event_ids(result) == ["40", "39", "38"]
+        assert result["data"]["filter_info"]["filters_applied"] == [
+            "preset=recent", "reverse=True", "limit=3", "fields=minimal",
+        ]
+        for event in result["data"]["events"]:
+            assert set(event) == {"eventId", "eventType", "eventTime"}
+    
+    def test_preset_last_failure_context(self, activity_executor):
+        """Test that the last failure and the 10 events before it are returned in full."""
+        result = _get_history(preset="last_failure_context")
+        
+        assert _event_ids(result) == [str(i) for i in range(20, 31)]
+        events = result["data"]["events"]
+        assert events[-1]["eventType"] == "WORKFLOW_TASK_FAILED"
+        payload = events[1]["activityTaskScheduledEventAttributes"]["input"]["payloads"][0]
+        assert payload["data"] == "plain text"
+    
+    def test_preset_resets(self, activity_executor):
+        """Test that the resets preset keeps only workflow task failures."""
+        result = _get_history(preset="resets")
+        
+        assert _event_ids(result) == ["25", "30"]
+        assert result["data"]["filter_info"]["original_event_count"] == 40
+    
+    def test_unknown_preset(self, activity_executor):
+        """Test that an unknown preset keeps all events and says so."""
+        result = _get_history(preset="nope")
+        
+        assert len(result["data"]["events"]) == 40
+        assert result["data"]["filter_info"]["filters_applied"] == [
+            "preset=nope (unknown, no filtering applied)",
+        ]
+    
+    def test_minimal_projection_skips_decoding(self, activity_executor, monkeypatch):
+        """Test that payloads are not decoded when the projection drops them."""
+        def fail_decode(events):
+            raise AssertionError("payloads should not be decoded")
+        
+        monkeypatch.setattr(history, "_decode_event_payloads", fail_decode)
+        result = _get_history(fields="minimal", limit=5)
+        
+        assert _event_ids(result) == ["1", "2", "3", "4", "5"]
+
+
+class TestPayloadDecoding:
+    """Test base64 payload decoding helpers."""
+    
+    def test_decode_is_copy_on_write(self):
+        """Test that decoding leaves the input events unchanged and shares untouched parts."""
+        events = _activity_history()
+        original = copy.deepcopy(events)
+        
+        decoded = history._decode_event_payloads(events)
+        
+        assert events == original
+        started = decoded[0]["workflowExecutionStartedEventAttributes"]
+        assert started["input"]["payloads"][0]["data"] == {"order": 1}
+        assert started["workflowType"] is events[0]["workflowExecutionStartedEventAttributes"]["workflowType"]
+        # Events without payloads are copied shallowly
+        assert decoded[1] == events[1]
+        assert decoded[1] is not events[1]
+    
+    @pytest.mark.parametrize("value, expected", [
+        (_b64('{"a": [1, 2]}'), {"a": [1, 2]}),
+        (_b64("42"), 42),
+        (_b64("hello world"), "hello world"),
+        (base64.b64encode(b"\x80\x81\x82").decode("ascii"), "<binary data: 3 bytes>"),
+        ("abc", "abc"),  # invalid base64 (padding) is kept as-is
+    ])
+    def test_decode_base64_value(self, value, expected):
+        """Test JSON, text, binary and invalid base64 values."""
+        assert history._decode_base64_value(value) == expected
+    
+    def test_long_text_is_truncated(self):
+        """Test that long decoded text is truncated."""
+        decoded = history._decode_base64_value(_b64("x" * (history.MAX_DECODED_STRING_LENGTH + 10)))
+        assert decoded.startswith("x" * history.MAX_DECODED_STRING_LENGTH)
+        assert decoded.endswith(f"of {history.MAX_DECODED_STRING_LENGTH + 10} characters]")
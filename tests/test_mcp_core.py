@@ -7,10 +7,13 @@ tool availability, and basic workflow operations.
 
 import os
 import json
+import asyncio
 import pytest
 import logging
 from typing import Dict, Any
 
+from temporal_cli_mcp.workflow import build_query, failed_runs
+
 from .mcp_client_simulator import TemporalMCPClientSimulator, temporal_mcp_client
 from .test_utils import (
     temporal_test_context, validate_mcp_response, validate_temporal_workflow_response,
@@ -86,7 +89,9 @@ class TestTemporalMCPCore:
             "get_workflow_history",
             "count_workflows",
             "build_workflow_query",
-            "validate_workflow_query"
+            "validate_workflow_query",
+            "validate_workflow_queries",
+            "get_failed_runs_batch"
         ]
         
         for tool_name in expected_tools:
@@ -196,6 +201,116 @@ class TestTemporalMCPCore:
         
         logger.info("✓ Query building tool working")
     
+    def test_validate_workflow_queries(self):
+        """Test batch query validation (called in-process, no CLI needed)."""
+        queries = [
+            "WorkflowType = 'TestWorkflow'",
+            "Foo LIKE 1",
+            "",
+            "WorkflowType = 'TestWorkflow'",
+        ]
+        
+        result = asyncio.run(build_query.validate_workflow_queries(queries))
+        
+        assert result["success"] is True
+        results = result["results"]
+        assert [r["query"] for r in results] == queries, "Results should follow input order"
+        
+        assert results[0]["is_valid"] is True
+        assert results[0]["issues"] == []
+        assert results[3] == results[0], "Duplicate queries should get the same result"
+        assert results[3] is not results[0], "Duplicate results should not share a dict"
+        
+        assert results[1]["is_valid"] is False
+        assert any("LIKE" in issue for issue in results[1]["issues"])
+        
+        assert results[2]["is_valid"] is False
+        assert results[2]["success"] is False
+        assert results[2]["suggestions"] == ["String should have at least 1 character"]
+        
+        logger.info("✓ Batch query validation working")
+    
+    def test_failed_runs_batch(self, monkeypatch):
+        """Test batch failed-run counts with a stubbed CLI."""
+        calls = []
+        
+        async def fake_run_temporal_command(args, *, output="json"):
+            query = args[args.index("--query") + 1]
+            calls.append(query)
+            if "broken" in query:
+                raise RuntimeError("CLI failure")
+            return {"success": True, "data": {"count": len(calls)}}
+        
+        monkeypatch.setattr(failed_runs, "run_temporal_command", fake_run_temporal_command)
+        monkeypatch.setattr(failed_runs, "_failed_count_cache", type(failed_runs._failed_count_cache)())
+        
+        result = asyncio.run(failed_runs.get_failed_runs_batch(
+            ["wf-a", "wf-b", "wf-a", "wf-broken", "wf-b"]
+        ))
+        
+        assert result["success"] is True
+        counts = result["failed_counts"]
+        assert list(counts) == ["wf-a", "wf-b", "wf-broken"], "IDs should be deduplicated in input order"
+        assert counts["wf-broken"] == 0, "A failed lookup should be reported as 0"
+        assert sorted(counts[wid] for wid in ("wf-a", "wf-b")) == [1, 2]
+        assert len(calls) == 3, "Each distinct ID should be looked up once"
+        
+        logger.info("✓ Batch failed-run counts working")
+    
+    def test_failed_runs_count_cache(self, monkeypatch):
+        """Test TTL caching, in-flight sharing and LRU bounds of failed-run counts."""
+        calls = []
+        responses = {}
+        
+        async def fake_run_temporal_command(args, *, output="json"):
+            query = args[args.index("--query") + 1]
+            calls.append(query)
+            await asyncio.sleep(0)
+            return responses.get(query, {"success": True, "data": {"count": 3}})
+        
+        monkeypatch.setattr(failed_runs, "run_temporal_command", fake_run_temporal_command)
+        cache = type(failed_runs._failed_count_cache)()
+        monkeypatch.setattr(failed_runs, "_failed_count_cache", cache)
+        
+        async def scenario():
+            # Repeat lookups within the TTL reuse the cached count
+            assert await failed_runs.get_failed_runs_count_only("wf-a") == 3
+            assert await failed_runs.get_failed_runs_count_only("wf-a") == 3
+            assert len(calls) == 1
+            
+            # An expired entry is fetched again
+            cache["wf-a"] = (cache["wf-a"][0] - failed_runs._FAILED_COUNT_TTL - 1, 3)
+            assert await failed_runs.get_failed_runs_count_only("wf-a") == 3
+            assert len(calls) == 2
+            
+            # Concurrent lookups of one workflow share a single CLI call
+            counts = await asyncio.gather(
+                *(failed_runs.get_failed_runs_count_only("wf-b") for _ in range(5))
+            )
+            assert counts == [3] * 5
+            assert len(calls) == 3
+            
+            # Failed CLI calls are not cached
+            calls.clear()
+            responses["WorkflowId = 'wf-c' AND ExecutionStatus = 'Failed'"] = {"success": False, "data": {}}
+            assert await failed_runs.get_failed_runs_count_only("wf-c") == 0
+            assert await failed_runs.get_failed_runs_count_only("wf-c") == 0
+            assert len(calls) == 2
+            assert "wf-c" not in cache
+            
+            # The cache is a bounded LRU
+            cache.clear()
+            for i in range(failed_runs._FAILED_COUNT_CACHE_SIZE + 1):
+                await failed_runs.get_failed_runs_count_only(f"wf-{i}")
+            assert len(cache) == failed_runs._FAILED_COUNT_CACHE_SIZE
+            assert "wf-0" not in cache, "Least recently used entry should be evicted"
+            assert f"wf-{failed_runs._FAILED_COUNT_CACHE_SIZE}" in cache
+        
+        asyncio.run(scenario())
+        assert not failed_runs._failed_count_inflight, "Finished lookups should not stay in flight"
+        
+        logger.info("✓ Failed-run count cache working")
+    
     def test_error_handling(self, mcp_client, test_environment):
         """Test error handling with invalid parameters."""
         # Test with invalid workflow ID
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Unit tests for TemporalQueryBuilder query rendering.
+Covers AND-joining, nested and/or combination, parenthesization and escaping.
+"""
+
+import pytest
+
+from temporal_cli_mcp.query_builder import ExecutionStatus, create_query_builder
+
+
+class TestQueryBuilderRendering:
+    """Test how built queries are rendered."""
+    
+    def test_empty_builder(self):
+        """Test that a builder without conditions renders an empty query."""
+        assert create_query_builder().build() == ""
+    
+    def test_conditions_joined_with_and(self):
+        """Test that plain conditions are AND-joined without parentheses."""
+        query = (
+            create_query_builder()
+            .workflow_type("OrderFlow")
+            .execution_status(ExecutionStatus.RUNNING)
+            .build()
+        )
+        assert query == "WorkflowType = 'OrderFlow' AND ExecutionStatus = 'Running'"
+    
+    def test_values_are_escaped(self):
+        """Test that quotes and backslashes in values are escaped."""
+        query = (
+            create_query_builder()
+            .workflow_id("it's\\here")
+            .workflow_id_in(["a'b", "c"])
+            .custom_field("Customer-Id", "o'neil")
+            .build()
+        )
+        assert query == (
+            "WorkflowId = 'it''s\\\\here' AND "
+            "WorkflowId IN ('a''b', 'c') AND "
+            "`Customer-Id` = 'o''neil'"
+        )
+    
+    def test_and_or_parenthesization(self):
+        """Test that and_condition/or_condition wrap both sides in parentheses."""
+        left = create_query_builder().workflow_type("A").execution_status("Failed")
+        right = create_query_builder().workflow_id("x")
+        
+        assert left.and_condition(right).build() == (
+            "(WorkflowType = 'A' AND ExecutionStatus = 'Failed') AND (WorkflowId = 'x')"
+        )
+        
+        other = create_query_builder().task_queue("q").run_id("r")
+        assert left.or_condition(other).build() == (
+            "((WorkflowType = 'A' AND ExecutionStatus = 'Failed') AND (WorkflowId = 'x')) "
+            "OR (TaskQueue = 'q' AND RunId = 'r')"
+        )
+    
+    def test_nested_combined_builders(self):
+        """Test combining builders that are themselves combinations."""
+        inner_left = create_query_builder().workflow_type("A").or_condition(
+            create_query_builder().workflow_type("B")
+        )
+        inner_right = create_query_builder().execution_status("Running").and_condition(
+            create_query_builder().task_queue("q")
+        )
+        
+        query = inner_left.and_condition(inner_right).build()
+        
+        assert query == (
+            "((WorkflowType = 'A') OR (WorkflowType = 'B')) AND "
+            "((ExecutionStatus = 'Running') AND (TaskQueue = 'q'))"
+        )
+    
+    def test_conditions_added_after_combination(self):
+        """Test that conditions added after a combination are AND-joined to it."""
+        query = (
+            create_query_builder()
+            .workflow_type("A")
+            .or_condition(create_query_builder().workflow_type("B"))
+            .task_queue("q")
+            .build()
+        )
+        assert query == "(WorkflowType = 'A') OR (WorkflowType = 'B') AND TaskQueue = 'q'"
+    
+    def test_combining_with_empty_builders(self):
+        """Test that an empty side is not parenthesized."""
+        other = create_query_builder().workflow_id("x").run_id("r")
+        
+        assert create_query_builder().and_condition(other).build() == "WorkflowId = 'x' AND RunId = 'r'"
+        assert create_query_builder().or_condition(other).build() == "WorkflowId = 'x' AND RunId = 'r'"
+        
+        builder = create_query_builder().workflow_id("x")
+        assert builder.or_condition(create_query_builder()).build() == "WorkflowId = 'x'"
+    
+    def test_combination_snapshots_other_builder(self):
+        """Test that later changes to a combined builder do not leak into the result."""
+        other = create_query_builder().workflow_id("x")
+        builder = create_query_builder().workflow_type("A").and_condition(other)
+        
+        other.run_id("r")
+        
+        assert builder.build() == "(WorkflowType = 'A') AND (WorkflowId = 'x')"
+    
+    def test_self_combination(self):
+        """Test combining a builder with itself."""
+        builder = create_query_builder().workflow_id("x")
+        assert builder.or_condition(builder).build() == "(WorkflowId = 'x') OR (WorkflowId = 'x')"
+    
+    def test_deep_chaining(self):
+        """Test that long and/or chains render without recursion limits."""
+        builder = create_query_builder().workflow_id("w0")
+        expected = "WorkflowId = 'w0'"
+        for i in range(1, 3000):
+            operator = "OR" if i % 2 else "AND"
+            other = create_query_builder().workflow_id(f"w{i}")
+            if operator == "OR":
+                builder.or_condition(other)
+            else:
+                builder.and_condition(other)
+            expected = f"({expected}) {operator} (WorkflowId = 'w{i}')"
+        
+        assert builder.build() == expected
+    
+    def test_extend_conditions(self):
+        """Test that raw conditions are stripped and empty ones rejected."""
+        query = create_query_builder().extend_conditions(["  A = 1 ", "B = 2"]).build()
+        assert query == "A = 1 AND B = 2"
+        
+        with pytest.raises(ValueError):
+            create_query_builder().extend_conditions(["A = 1", "   "])